@@ -1,11 +1,12 @@
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 from datetime import datetime
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request as StarletteRequest
+import asyncio
 import uvicorn
 import logging
 import traceback
@@ -18,7 +19,9 @@ from src.modules.room.router import router as room_router
 from src.modules.profile.router import router as profile_router
 from src.modules.chat.router import router as chat_router
 from src.modules.game.router import router as game_router
-from src.core.socket import create_socketio_app
+from src.core.socket import create_socketio_app, sio
+from src.core.socket.broadcast import broadcast_queue, emit_batcher
+from src.modules.chat.service import chat_service
 
 # Logging configuration
 logging.basicConfig(
@@ -49,10 +52,19 @@ async def lifespan(app: FastAPI):
         logger.error(f"MongoDB connection failed: {e}")
         raise
     
+    # 끊긴 연결의 소켓 세션 캐시 정리
+    session_cache_janitor = asyncio.create_task(sio.run_session_cache_janitor())
+    
     yield
     
     # Execute on shutdown
     logger.info("Shutting down application...")
+    session_cache_janitor.cancel()
+    # write delay 대기 중인 배치를 먼저 큐로 넘긴 뒤 큐를 비우고 종료
+    if emit_batcher is not None:
+        emit_batcher.flush_all(sio)
+    await broadcast_queue.stop()
+    await chat_service.flush_pending_messages()
     await close_mongo_connection()
     logger.info("MongoDB connection closed.")
 
@@ -61,6 +73,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
     lifespan=lifespan,
+    # 응답 직렬화를 orjson으로 처리 (JSONResponse를 직접 반환하는 핸들러는 그대로 유지)
+    default_response_class=ORJSONResponse,
     # Provide detailed error information
     openapi_url="/openapi.json" if settings.DEBUG else None,
     docs_url="/docs" if settings.DEBUG else None,
@@ -266,6 +280,7 @@ if __name__ == "__main__":
         socket_app,  # Socket.IO가 통합된 앱 사용
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",  # sio.emit 등 소켓 I/O를 uvloop 이벤트 루프에서 처리
         log_level="info",
         access_log=True,
         use_colors=True
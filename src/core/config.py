@@ -29,6 +29,12 @@ class Settings(BaseSettings):
     
     # 로깅 설정
     LOG_LEVEL: str
+    SOCKETIO_DEBUG_LOGGING: bool = False  # Socket.IO/Engine.IO 패킷 단위 로깅 (디버깅 전용)
+    
+    # Socket.IO 브로드캐스트 설정
+    SOCKETIO_BROADCAST_WRITE_DELAY_MS: int = 0  # 0보다 크면 방별 채팅 브로드캐스트를 해당 시간 동안 모아서 전송
+    SOCKETIO_BROADCAST_MAX_BATCH: int = 32  # 모인 메시지가 이 개수에 도달하면 write delay 전이라도 즉시 전송
+    SOCKETIO_PROFILE_CACHE_TTL_SECONDS: int = 300  # 소켓 세션에 캐시한 프로필(profile_id, display_name) 재조회 주기
     
     # LLM API 설정
     LLM_API_BASE_URL: str
@@ -1,3 +1,4 @@
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 import jwt
@@ -12,11 +13,16 @@ from src.modules.user.models.user import User
 logger = logging.getLogger(__name__)
 
 class JWTManager:
+    # 검증 결과 캐시 최대 항목 수 (가득 차면 가장 오래된 항목부터 제거)
+    VERIFIED_CACHE_MAX_SIZE = 4096
+    
     def __init__(self) -> None:
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
+        # 토큰 문자열 -> 검증된 payload (서명 검증 성공한 토큰만 저장, 만료는 조회 시 exp로 확인)
+        self._verified_cache: Dict[str, Dict[str, Any]] = {}
     
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """액세스 토큰 생성"""
@@ -35,10 +41,25 @@ class JWTManager:
         return encoded_jwt
     
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
-        """토큰 검증"""
+        """토큰 검증 - 이미 검증한 토큰은 서명 검증/디코드 없이 캐시에서 반환"""
+        cached = self._verified_cache.get(token)
+        if cached is not None:
+            if cached["exp"] > time.time():
+                # 호출 측에서 수정해도 캐시가 오염되지 않도록 복사본 반환
+                return dict(cached)
+            self._verified_cache.pop(token, None)
+            logger.warning("Token has expired")
+            return None
+        
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            logger.info(f"Token verified successfully for user_id: {payload.get('user_id')}")
+            logger.info("Token verified successfully for user_id: %s", payload.get('user_id'))
+            # 실패한 토큰은 저장하지 않음 (잘못된 토큰으로 캐시를 채우는 것 방지)
+            if isinstance(payload.get("exp"), (int, float)):
+                if len(self._verified_cache) >= self.VERIFIED_CACHE_MAX_SIZE:
+                    del self._verified_cache[next(iter(self._verified_cache))]
+                self._verified_cache[token] = payload
+                return dict(payload)
             return payload
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
@@ -122,7 +143,8 @@ class JWTManager:
         }
         access_token = self.create_access_token(user_data)
         refresh_token = self.create_refresh_token(user_data)
-        return TokenPair(
+        # 직접 발급한 토큰이므로 검증 생략
+        return TokenPair.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="bearer",
@@ -87,6 +87,17 @@ class MongoRepository(BaseRepository[T]):
             print(f"Error finding entity: {e}")
             return None
     
+    async def find_fields(self, filter_dict: Dict[str, Any], fields: List[str]) -> Optional[Dict[str, Any]]:
+        """조건으로 단일 문서의 일부 필드만 조회 (엔티티 변환 없이 dict 반환, _id 제외)"""
+        try:
+            collection = self._get_collection()
+            projection = dict.fromkeys(fields, 1)
+            projection["_id"] = 0
+            return await collection.find_one(filter_dict, projection)
+        except Exception as e:
+            print(f"Error finding fields {fields}: {e}")
+            return None
+    
     async def find_many(self, filter_dict: Dict[str, Any], skip: int = 0, limit: int = 0) -> List[T]:
         """조건으로 여러 엔티티 조회"""
         try:
@@ -121,6 +132,22 @@ class MongoRepository(BaseRepository[T]):
             print(f"Error creating entity: {e}")
             raise
     
+    async def create_many(self, entities: List[T]) -> List[str]:
+        """엔티티 일괄 생성 (단일 insert_many 호출)"""
+        try:
+            collection = self._get_collection()
+            entity_dicts = []
+            for entity in entities:
+                entity_dict = entity.model_dump() if hasattr(entity, 'model_dump') else dict(entity.__dict__)
+                entity_dict.pop("id", None)
+                entity_dicts.append(entity_dict)
+            
+            result = await collection.insert_many(entity_dicts, ordered=True)
+            return [str(inserted_id) for inserted_id in result.inserted_ids]
+        except Exception as e:
+            print(f"Error creating entities: {e}")
+            raise
+    
     async def update(self, id: str, update_dict: Dict[str, Any]) -> bool:
         """엔티티 업데이트"""
         try:
@@ -65,6 +65,10 @@ class SessionManager:
     
     async def update_session_activity(self, sid: str) -> None:
         """세션 활동 시간 업데이트"""
+        self.touch(sid)
+    
+    def touch(self, sid: str) -> None:
+        """세션 활동 시간 업데이트 (동기 버전 - ping 등 고빈도 경로용)"""
         self.session_activity[sid] = datetime.utcnow()
     
     def get_profile_room(self, profile_id: str) -> Optional[str]:
@@ -1,4 +1,5 @@
-from .server import sio, connected_profiles, room_profiles, create_socketio_app
+from .server import sio, create_socketio_app
+from .state import connected_profiles, room_profiles
 from .handler import SocketMessageHandler
 from .models import (
     SocketEventType, BaseSocketMessage,
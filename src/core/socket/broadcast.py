@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 큐 항목: (sio, event, payload, room_id, skip_sid)
+BroadcastItem = Tuple[Any, str, Dict[str, Any], str, Optional[str]]
+
+class BroadcastQueue:
+    """채팅 브로드캐스트 큐 - 메시지 수신 코루틴과 emit을 분리
+
+    방 ID 기준으로 샤딩된 큐마다 drain 태스크 하나가 붙으므로
+    같은 방의 메시지 순서는 유지된다.
+    """
+
+    def __init__(self, workers: Optional[int] = None, maxsize: int = 1024) -> None:
+        self.workers = workers or min(8, (os.cpu_count() or 1) * 2)
+        self.maxsize = maxsize
+        self._queues: List[asyncio.Queue] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def _ensure_started(self) -> None:
+        """실행 중인 이벤트 루프에서 drain 태스크를 최초 1회 생성"""
+        if self._tasks:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.maxsize) for _ in range(self.workers)]
+        self._tasks = [asyncio.create_task(self._drain(queue)) for queue in self._queues]
+        logger.info("Broadcast queue started with %s workers", self.workers)
+
+    def enqueue(self, sio, event: str, payload: Dict[str, Any], room_id: str, skip_sid: Optional[str] = None) -> bool:
+        """브로드캐스트 예약 - 큐가 가득 차면 False 반환"""
+        self._ensure_started()
+        queue = self._queues[hash(room_id) % self.workers]
+        try:
+            queue.put_nowait((sio, event, payload, room_id, skip_sid))
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Broadcast queue full, dropping %s for room %s", event, room_id)
+            return False
+
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        """큐에 쌓인 브로드캐스트를 순서대로 전송"""
+        while True:
+            sio, event, payload, room_id, skip_sid = await queue.get()
+            try:
+                await sio.manager.emit(event, payload, '/', room=room_id, skip_sid=skip_sid)
+            except Exception as e:
+                logger.error("Broadcast error for room %s: %s", room_id, e)
+            finally:
+                queue.task_done()
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """남은 브로드캐스트를 timeout까지 전송한 뒤 drain 태스크 종료"""
+        if self._queues:
+            try:
+                await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self._queues)), timeout)
+            except asyncio.TimeoutError:
+                dropped = sum(queue.qsize() for queue in self._queues)
+                logger.warning("Broadcast queue drain timed out after %ss, dropping %s pending broadcasts", timeout, dropped)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queues = []
+
+class RoomEmitBatcher:
+    """방/이벤트별 브로드캐스트를 write_delay 동안 모아서 한 프레임으로 전송
+
+    모인 메시지가 1건이면 원래 이벤트로, 여러 건이면 `<event>_batch` 이벤트에 리스트로 전송한다.
+    max_batch건이 모이면 write_delay를 기다리지 않고 바로 전송한다.
+    멀티 워커(메시지 큐 매니저) 구성에서는 emit 1회가 publish 1회이므로 publish 횟수도 같은 비율로 줄어든다.
+    """
+
+    def __init__(self, queue: BroadcastQueue, write_delay: float, max_batch: int = 32) -> None:
+        self.queue = queue
+        self.write_delay = write_delay
+        self.max_batch = max_batch
+        self._pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+
+    def push(self, sio, event: str, payload: Dict[str, Any], room_id: str) -> None:
+        """브로드캐스트 예약 - 방/이벤트의 첫 메시지에서 flush 타이머 시작"""
+        key = (room_id, event)
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.append(payload)
+            if len(pending) >= self.max_batch:
+                self._timers.pop(key).cancel()
+                self._flush(sio, key)
+            return
+        self._pending[key] = [payload]
+        self._timers[key] = asyncio.get_running_loop().call_later(self.write_delay, self._flush, sio, key)
+
+    def _flush(self, sio, key: Tuple[str, str]) -> None:
+        """모인 메시지를 브로드캐스트 큐로 전달"""
+        self._timers.pop(key, None)
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        room_id, event = key
+        if len(batch) == 1:
+            enqueued = self.queue.enqueue(sio, event, batch[0], room_id)
+        else:
+            enqueued = self.queue.enqueue(sio, f"{event}_batch", batch, room_id)
+        if not enqueued:
+            # 발신자에게는 이미 접수 처리되었으므로 유실 건수를 남김
+            logger.error("Dropped %s batched %s messages for room %s (broadcast queue full)", len(batch), event, room_id)
+    
+    def flush_all(self, sio) -> None:
+        """write delay를 기다리는 모든 배치를 즉시 브로드캐스트 큐로 전달 (종료 시 호출)"""
+        for key in list(self._pending):
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            self._flush(sio, key)
+
+# 전역 인스턴스
+broadcast_queue = BroadcastQueue()
+emit_batcher: Optional[RoomEmitBatcher] = (
+    RoomEmitBatcher(
+        broadcast_queue,
+        settings.SOCKETIO_BROADCAST_WRITE_DELAY_MS / 1000,
+        settings.SOCKETIO_BROADCAST_MAX_BATCH
+    )
+    if settings.SOCKETIO_BROADCAST_WRITE_DELAY_MS > 0 else None
+)
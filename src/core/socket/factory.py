@@ -1,99 +1,50 @@
-from typing import Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 import logging
-from .interfaces import SocketEventType
+from .models.socket_event_type import SocketEventType
 # 순환 import 방지를 위해 직접 strategy.py에서 import
-from .strategy import (
-    SocketMessageStrategy,
-    AuthConnectStrategy,
-    AuthDisconnectStrategy,
-    RoomJoinStrategy,
-    RoomLeaveStrategy,
-    StartGameStrategy,
-    FinishGameStrategy,
-    LobbyMessageStrategy,
-    GameMessageStrategy,
-    SystemMessageStrategy,
-    ReadyStrategy,
-    # 게임 관련 전략들 추가
-    CreateGameStrategy,
-    CreateContextStrategy,
-    CreateAgendaStrategy,
-    CreateTaskStrategy,
-    CreateOvertimeStrategy,
-    UpdateContextStrategy,
-    CreateExplanationStrategy,
-    CalculateResultStrategy,
-    GetGameProgressStrategy,
-    # 아젠다 투표 전략 추가
-    AgendaVoteStrategy,
-    # 아젠다 네비게이션 전략 추가
-    AgendaNavigateStrategy,
-    # 태스크 완료 전략 추가
-    TaskCompletedStrategy,
-    # 태스크 네비게이션 전략 추가
-    TaskNavigateStrategy,
-)
+from .strategy import SocketMessageStrategy, STRATEGIES
 
 logger = logging.getLogger(__name__)
 
+# 이벤트 처리 코루틴 함수 (sio, sid, data) -> Optional[BaseSocketMessage]
+StrategyHandler = Callable[[Any, str, Dict[str, Any]], Awaitable[Any]]
+
 class SocketMessageStrategyFactory:
     """Socket message strategy factory"""
     
     def __init__(self) -> None:
         self._strategies: Dict[SocketEventType, SocketMessageStrategy] = {}
+        # 이벤트 이름(str) -> 바운드 handle 코루틴 (디스패치 전용 평면 테이블)
+        # Enum 멤버 키는 해시가 파이썬 레벨 Enum.__hash__ 호출이므로 캐시된 str 해시를 쓰는 값으로 키잉
+        self._handlers: Dict[str, StrategyHandler] = {}
         self._initialize_strategies()
     
     def _initialize_strategies(self) -> None:
         """Initialize strategies"""
-        strategies = [
-            AuthConnectStrategy(),
-            AuthDisconnectStrategy(),
-            RoomJoinStrategy(),
-            RoomLeaveStrategy(),
-            StartGameStrategy(),
-            FinishGameStrategy(),
-            LobbyMessageStrategy(),
-            GameMessageStrategy(),
-            SystemMessageStrategy(),
-            ReadyStrategy(),
-            # 게임 관련 전략들 추가
-            CreateGameStrategy(),
-            CreateContextStrategy(),
-            CreateAgendaStrategy(),
-            CreateTaskStrategy(),
-            CreateOvertimeStrategy(),
-            UpdateContextStrategy(),
-            CreateExplanationStrategy(),
-            CalculateResultStrategy(),
-            GetGameProgressStrategy(),
-            # 아젠다 투표 전략 추가
-            AgendaVoteStrategy(),
-            # 아젠다 네비게이션 전략 추가
-            AgendaNavigateStrategy(),
-            # 태스크 완료 전략 추가
-            TaskCompletedStrategy(),
-            # 태스크 네비게이션 전략 추가
-            TaskNavigateStrategy(),
-        ]
-        
-        for strategy in strategies:
+        for strategy in STRATEGIES:
             self._strategies[strategy.get_event_type()] = strategy
-            logger.debug(f"Registered strategy for {strategy.get_event_type()}")
+            self._handlers[strategy.get_event_type().value] = strategy.handle
+            logger.debug("Registered strategy for %s", strategy.get_event_type())
     
     def get_strategy(self, event_type: SocketEventType) -> Optional[SocketMessageStrategy]:
         """Get strategy by event type"""
         strategy = self._strategies.get(event_type)
         if not strategy:
-            logger.warning(f"No strategy found for event type: {event_type}")
+            logger.warning("No strategy found for event type: %s", event_type)
             return None
         
-        logger.debug(f"Retrieved strategy for {event_type}: {strategy.__class__.__name__}")
+        logger.debug("Retrieved strategy for %s: %s", event_type, strategy.__class__.__name__)
         return strategy
     
+    def get_handler_table(self) -> Dict[str, StrategyHandler]:
+        """Get live event name -> handle coroutine table used for dispatch"""
+        return self._handlers
+    
     def register_strategy(self, event_type: SocketEventType, strategy: SocketMessageStrategy) -> None:
         """Register new strategy"""
         self._strategies[event_type] = strategy
-        logger.info(f"Registered new strategy for {event_type}: {strategy.__class__.__name__}")
+        self._handlers[event_type.value] = strategy.handle
+        logger.info("Registered new strategy for %s: %s", event_type, strategy.__class__.__name__)
     
     def get_supported_event_types(self) -> list:
         """Get list of supported event types"""
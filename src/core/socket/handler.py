@@ -1,70 +1,53 @@
 from typing import Dict, Any, Optional
 import logging
-from .interfaces import BaseSocketMessage, SocketEventType
+from .models import BaseSocketMessage, SocketEventType
+from .socket_logging import log_socket_message
 from .factory import get_strategy_factory
 
 logger = logging.getLogger(__name__)
 
-def log_socket_message(level: str, message: str, **kwargs) -> None:
-    """소켓 메시지 전용 로깅 함수"""
-    colors = {
-        'INFO': '\033[94m',      # 파란색
-        'SUCCESS': '\033[92m',   # 초록색
-        'WARNING': '\033[93m',   # 노란색
-        'ERROR': '\033[91m',     # 빨간색
-    }
-    
-    color = colors.get(level, '')
-    reset = '\033[0m'
-    
-    # 한 줄로 모든 정보 정리
-    if kwargs:
-        details = " ".join([f"{k}={v}" for k, v in kwargs.items()])
-        log_msg = f"{color}[SOCKET] {message} {details}{reset}"
-    else:
-        log_msg = f"{color}[SOCKET] {message}{reset}"
-    
-    if level == 'ERROR':
-        logger.error(log_msg)
-    elif level == 'WARNING':
-        logger.warning(log_msg)
-    else:
-        logger.info(log_msg)
-
 class SocketMessageHandler:
     """Socket message handler - uses strategy and factory patterns"""
     
+    __slots__ = ('sio', 'strategy_factory', '_handlers')
+    
     def __init__(self, sio) -> None:
         self.sio = sio
         self.strategy_factory = get_strategy_factory()
-        logger.info(f"Socket message handler initialized with {len(self.strategy_factory.get_supported_event_types())} strategies")
+        self._handlers = self.strategy_factory.get_handler_table()
+        logger.info("Socket message handler initialized with %s strategies", len(self.strategy_factory.get_supported_event_types()))
     
     async def handle_message(self, event_type: SocketEventType, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
         """Handle message - applies strategy pattern"""
-        log_socket_message('INFO', '수신', event=event_type, sid=sid[:8], data=str(data)[:100])
+        sid8 = sid[:8]
+        event_name = event_type.value
+        if logger.isEnabledFor(logging.INFO):
+            log_socket_message('INFO', '수신', event=event_name, sid=sid8, data=str(data)[:100])
         
         try:
-            strategy = self.strategy_factory.get_strategy(event_type)
-            if not strategy:
-                log_socket_message('ERROR', '지원하지 않는 이벤트', event=event_type)
-                await self._send_error(sid, f"Unsupported event type: {event_type}")
+            handler = self._handlers.get(event_name)
+            if handler is None:
+                log_socket_message('ERROR', '지원하지 않는 이벤트', event=event_name)
+                await self._send_error(sid, f"Unsupported event type: {event_name}")
                 return None
             
-            result = await strategy.handle(self.sio, sid, data)
+            result = await handler(self.sio, sid, data)
             
             if result:
-                log_socket_message('SUCCESS', '완료', event=event_type, sid=sid[:8])
+                log_socket_message('SUCCESS', '완료', event=event_name, sid=sid8)
             else:
-                log_socket_message('WARNING', '실패', event=event_type, sid=sid[:8])
+                log_socket_message('WARNING', '실패', event=event_name, sid=sid8)
             
             return result
             
         except Exception as e:
-            import traceback
-            error_traceback = traceback.format_exc()
-            log_socket_message('ERROR', '오류', event=event_type, sid=sid[:8], error=str(e))
-            logger.error(f"Full error traceback for {event_type}: {error_traceback}")
-            await self._send_error(sid, f"An error occurred while handling the message: {str(e)}")
+            # 전략별 try/except 대신 디스패처에서 예외를 한 번에 처리
+            log_socket_message('ERROR', '오류', event=event_name, sid=sid8, error=str(e))
+            # 트레이스백은 로거가 출력할 때만 포맷됨
+            logger.exception("Full error traceback for %s", event_name)
+            strategy = self.strategy_factory.get_strategy(event_type)
+            error_message = getattr(strategy, 'ERROR_MESSAGE', None) or "An error occurred while handling the message"
+            await self._send_error(sid, f"{error_message}: {str(e)}")
             return None
     
     async def _send_error(self, sid: str, message: str) -> None:
@@ -74,7 +57,8 @@ class SocketMessageHandler:
     
     async def _send_success(self, sid: str, data: Dict[str, Any]) -> None:
         """성공 메시지 전송"""
-        log_socket_message('SUCCESS', '전송', event='success', sid=sid[:8], data=str(data)[:50])
+        if logger.isEnabledFor(logging.INFO):
+            log_socket_message('SUCCESS', '전송', event='success', sid=sid[:8], data=str(data)[:50])
         await self.sio.emit('success', data, room=sid)
     
     def get_supported_event_types(self) -> list[SocketEventType]:
@@ -84,7 +68,7 @@ class SocketMessageHandler:
     def register_custom_strategy(self, event_type: SocketEventType, strategy) -> None:
         """사용자 정의 전략 등록"""
         self.strategy_factory.register_strategy(event_type, strategy)
-        logger.info(f"Registered custom strategy for {event_type}")
+        logger.info("Registered custom strategy for %s", event_type)
     
     def has_strategy(self, event_type: SocketEventType) -> bool:
         """특정 이벤트 타입에 대한 전략 존재 여부 확인"""
@@ -1,43 +1,11 @@
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
-from datetime import datetime
+# 소켓 메시지 모델은 models 패키지에만 정의하고 여기서는 재노출만 함
 from .models.socket_event_type import SocketEventType
-
-class BaseSocketMessage(BaseModel):
-    """기본 Socket 메시지 모델"""
-    event_type: SocketEventType
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-    data: Dict[str, Any] = Field(default_factory=dict)
-    
-    class Config:
-        use_enum_values = True
-
-# 구체적인 메시지 모델들
-class AuthMessage(BaseSocketMessage):
-    """인증 메시지"""
-    token: Optional[str] = None
-    user_id: Optional[str] = None
-    username: Optional[str] = None
-
-class RoomMessage(BaseSocketMessage):
-    """방 관련 메시지"""
-    room_id: str
-    password: Optional[str] = None
-    profile_id: Optional[str] = None
-    username: Optional[str] = None
-
-class ChatMessage(BaseSocketMessage):
-    """채팅 메시지"""
-    room_id: str
-    profile_id: str
-    username: str
-    display_name: str
-    message: str
-    message_type: str = "text"
-    encrypted: bool = False
-
-class SystemMessage(BaseSocketMessage):
-    """시스템 메시지"""
-    room_id: str
-    content: str
-    message_type: str = "system" 
\ No newline at end of file
+from .models.base_socket_message import BaseSocketMessage
+from .models.auth_message import AuthMessage
+from .models.room_message import RoomMessage
+from .models.chat_message import ChatMessage
+
+__all__ = [
+    'SocketEventType', 'BaseSocketMessage',
+    'AuthMessage', 'RoomMessage', 'ChatMessage'
+]
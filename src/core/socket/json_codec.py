@@ -0,0 +1,12 @@
+# Socket.IO/Engine.IO 패킷 인코딩용 orjson 기반 json 모듈 대체
+import orjson
+
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def dumps(obj, **kwargs) -> str:
+    """json.dumps 호환 - separators 등 stdlib 전용 인자는 무시 (orjson은 항상 compact 출력)"""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS).decode()
+
+def loads(s, **kwargs):
+    """json.loads 호환"""
+    return orjson.loads(s)
@@ -1,26 +1,114 @@
+import asyncio
 import socketio
 from fastapi import FastAPI
-from typing import Dict, List
-from datetime import datetime
+from typing import Any, Dict, Optional
 import logging
 
-from .handler import SocketMessageHandler
+from src.core.config import settings
+from src.core.session_manager import session_manager
+from .handler import SocketMessageHandler, log_socket_message
 from .models.socket_event_type import SocketEventType
+from .timestamp import now_iso
+from . import json_codec
+from .state import room_profiles
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+class SessionCachingServer(socketio.AsyncServer):
+    """sid -> 세션 dict를 프로세스 메모리에 캐시하는 AsyncServer
+    
+    Socket.IO 세션은 원래 프로세스 내 Engine.IO 세션에 저장되므로 워커가 여러 개여도 캐시가 어긋나지 않음.
+    save_session을 거친 세션만 캐시하며 (기본 namespace 한정) 연결 해제 시 drop_cached_session으로 제거.
+    """
+    
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._session_cache: Dict[str, Dict[str, Any]] = {}
+    
+    def get_cached_session(self, sid: str) -> Optional[Dict[str, Any]]:
+        """캐시된 세션 동기 조회 (없으면 None)"""
+        return self._session_cache.get(sid)
+    
+    def drop_cached_session(self, sid: str) -> None:
+        """캐시된 세션 제거"""
+        self._session_cache.pop(sid, None)
+    
+    def purge_disconnected_sessions(self) -> int:
+        """연결이 끊긴 sid의 캐시 항목 제거 (disconnect 처리가 누락된 경우 대비) - 제거 건수 반환"""
+        stale = [sid for sid in self._session_cache if not self.manager.is_connected(sid, '/')]
+        for sid in stale:
+            del self._session_cache[sid]
+        return len(stale)
+    
+    async def run_session_cache_janitor(self, interval: float = 60.0) -> None:
+        """주기적으로 끊긴 연결의 세션 캐시 정리"""
+        while True:
+            await asyncio.sleep(interval)
+            purged = self.purge_disconnected_sessions()
+            if purged:
+                logger.info("Purged %s stale socket sessions", purged)
+    
+    def has_room_members(self, room_id: str, namespace: str = '/') -> bool:
+        """방에 참가 중인 sid가 있는지 확인 (Socket.IO 매니저의 room 목록 기준 - 연결 해제 시 자동 정리됨)"""
+        return bool(self.manager.rooms.get(namespace, {}).get(room_id))
+    
+    def invalidate_cached_profile(self, user_id: str) -> None:
+        """사용자의 모든 소켓 세션에서 캐시된 프로필 무효화 (다음 메시지에서 DB 재조회)"""
+        for session in self._session_cache.values():
+            if session.get('user_id') == user_id:
+                session.pop('display_name', None)
+    
+    async def save_session(self, sid, session, namespace=None):
+        await super().save_session(sid, session, namespace=namespace)
+        if namespace in (None, '/'):
+            self._session_cache[sid] = session
+
 # Socket.IO 서버 생성
-sio = socketio.AsyncServer(
+sio = SessionCachingServer(
     async_mode='asgi',
     cors_allowed_origins="*",  # 개발 환경에서는 모든 origin 허용
-    logger=False,  # Socket.IO 로거 비활성화
-    engineio_logger=False  # Engine.IO 로거 비활성화
+    json=json_codec,  # orjson 기반 패킷 인코딩
+    logger=settings.SOCKETIO_DEBUG_LOGGING,  # Socket.IO 로거 (기본 비활성화)
+    engineio_logger=settings.SOCKETIO_DEBUG_LOGGING  # Engine.IO 로거 (기본 비활성화)
+)
+
+# 핸들러로 그대로 전달되는 이벤트 (connect/disconnect/ping 제외)
+FORWARDED_EVENTS = (
+    SocketEventType.JOIN_ROOM,
+    SocketEventType.LEAVE_ROOM,
+    SocketEventType.READY,
+    SocketEventType.START_GAME,
+    SocketEventType.FINISH_GAME,
+    # LLM 게임 관련
+    SocketEventType.CREATE_GAME,
+    SocketEventType.CREATE_CONTEXT,
+    SocketEventType.CREATE_AGENDA,
+    SocketEventType.CREATE_TASK,
+    SocketEventType.CREATE_OVERTIME,
+    SocketEventType.UPDATE_CONTEXT,
+    SocketEventType.CREATE_EXPLANATION,
+    SocketEventType.CALCULATE_RESULT,
+    SocketEventType.GET_GAME_PROGRESS,
+    # 채팅 관련
+    SocketEventType.LOBBY_MESSAGE,
+    SocketEventType.SYSTEM_MESSAGE,
+    SocketEventType.GAME_MESSAGE,
+    # 아젠다 투표/태스크 관련
+    SocketEventType.VOTE_AGENDA,
+    SocketEventType.AGENDA_NAVIGATE,
+    SocketEventType.TASK_COMPLETED,
+    SocketEventType.TASK_NAVIGATE,
+    SocketEventType.AGENDA_VOTE_BROADCAST,
+    SocketEventType.AGENDA_VOTE_COMPLETED,
+    SocketEventType.TASK_CREATED,
 )
 
-# 연결된 프로필 관리 (전역 상태)
-connected_profiles: Dict[str, Dict] = {}  # sid -> profile_info
-room_profiles: Dict[str, List[str]] = {}  # room_id -> [sid1, sid2, ...]
+def _make_forward_handler(message_handler: SocketMessageHandler, event_type: SocketEventType):
+    """이벤트 타입을 메시지 핸들러로 전달하는 Socket.IO 핸들러 생성"""
+    async def handler(sid, data=None):
+        await message_handler.handle_message(event_type, sid, data or {})
+    return handler
 
 # Socket.IO 앱 생성 함수
 def create_socketio_app(fastapi_app: FastAPI) -> socketio.ASGIApp:
@@ -35,190 +123,53 @@ def create_socketio_app(fastapi_app: FastAPI) -> socketio.ASGIApp:
         try:
             await message_handler.handle_message(SocketEventType.CONNECT, sid, auth or {})
         except Exception as e:
-            logger.error(f"Connect error: {str(e)}")
+            logger.error("Connect error: %s", e)
             raise socketio.exceptions.ConnectionRefusedError(str(e))
     
     @sio.event
     async def ping(sid, data):
         """클라이언트 핑 이벤트 - 세션 활동 업데이트"""
         try:
-            from src.core.session_manager import session_manager
-            await session_manager.update_session_activity(sid)
-            await sio.emit('pong', {'timestamp': datetime.utcnow().isoformat()}, room=sid)
-            
-            # pong 전송 로깅 추가
-            from .handler import log_socket_message
-            log_socket_message('INFO', '전송', event='pong', sid=sid[:8])
+            # 고빈도 이벤트이므로 핸들러 디스패치/로깅 없이 바로 응답
+            session_manager.touch(sid)
+            await sio.emit('pong', {'timestamp': now_iso()}, room=sid)
         except Exception as e:
-            logger.error(f"Ping error: {str(e)}")
+            logger.error("Ping error: %s", e)
     
     @sio.event
     async def disconnect(sid):
         """클라이언트 연결 해제 이벤트"""
         await message_handler.handle_message(SocketEventType.DISCONNECT, sid, {})
     
-    @sio.event
-    async def join_room(sid, data):
-        """방 입장 이벤트"""
-        await message_handler.handle_message(SocketEventType.JOIN_ROOM, sid, data)
-    
-    @sio.event
-    async def leave_room(sid, data):
-        """방 나가기 이벤트"""
-        await message_handler.handle_message(SocketEventType.LEAVE_ROOM, sid, data)
-    
-    @sio.event
-    async def ready(sid, data):
-        """플레이어 레디/언레디 이벤트"""
-        await message_handler.handle_message(SocketEventType.READY, sid, data)
-    
-    @sio.event
-    async def start_game(sid, data):
-        """게임 시작 이벤트"""
-        await message_handler.handle_message(SocketEventType.START_GAME, sid, data)
-    
-    @sio.event
-    async def finish_game(sid, data):
-        """게임 종료 이벤트"""
-        await message_handler.handle_message(SocketEventType.FINISH_GAME, sid, data)
-    
-    # LLM 게임 관련 이벤트 핸들러들
-    @sio.event
-    async def create_game(sid, data):
-        """LLM 게임 생성 이벤트"""
-        await message_handler.handle_message(SocketEventType.CREATE_GAME, sid, data)
-    
-    @sio.event
-    async def create_context(sid, data):
-        """컨텍스트 생성 이벤트"""
-        await message_handler.handle_message(SocketEventType.CREATE_CONTEXT, sid, data)
-    
-    @sio.event
-    async def create_agenda(sid, data):
-        """아젠다 생성 이벤트"""
-        await message_handler.handle_message(SocketEventType.CREATE_AGENDA, sid, data)
-    
-    @sio.event
-    async def create_task(sid, data):
-        """태스크 생성 이벤트"""
-        await message_handler.handle_message(SocketEventType.CREATE_TASK, sid, data)
-    
-    @sio.event
-    async def create_overtime(sid, data):
-        """오버타임 생성 이벤트"""
-        await message_handler.handle_message(SocketEventType.CREATE_OVERTIME, sid, data)
-    
-    @sio.event
-    async def update_context(sid, data):
-        """컨텍스트 업데이트 이벤트"""
-        await message_handler.handle_message(SocketEventType.UPDATE_CONTEXT, sid, data)
-    
-    @sio.event
-    async def create_explanation(sid, data):
-        """설명 생성 이벤트"""
-        await message_handler.handle_message(SocketEventType.CREATE_EXPLANATION, sid, data)
-    
-    @sio.event
-    async def calculate_result(sid, data):
-        """결과 계산 이벤트"""
-        await message_handler.handle_message(SocketEventType.CALCULATE_RESULT, sid, data)
-    
-    @sio.event
-    async def get_game_progress(sid, data):
-        """게임 진행 상황 조회 이벤트"""
-        await message_handler.handle_message(SocketEventType.GET_GAME_PROGRESS, sid, data)
-    
-    @sio.event
-    async def send_message(sid, data):
-        """채팅 메시지 전송 이벤트"""
-        await message_handler.handle_message(SocketEventType.SEND_MESSAGE, sid, data)
-    
-    @sio.event
-    async def get_chat_history(sid, data):
-        """채팅 기록 조회 이벤트"""
-        await message_handler.handle_message(SocketEventType.GET_CHAT_HISTORY, sid, data)
-    
-    @sio.event
-    async def lobby_message(sid, data):
-        """로비 메시지 이벤트"""
-        await message_handler.handle_message(SocketEventType.LOBBY_MESSAGE, sid, data)
-    
-    @sio.event
-    async def system_message(sid, data):
-        """시스템 메시지 이벤트"""
-        await message_handler.handle_message(SocketEventType.SYSTEM_MESSAGE, sid, data)
-    
-    @sio.event
-    async def game_message(sid, data):
-        """게임 메시지 이벤트"""
-        await message_handler.handle_message(SocketEventType.GAME_MESSAGE, sid, data)
-    
-    # 아젠다 투표 관련 이벤트 핸들러들
-    @sio.event
-    async def vote_agenda(sid, data):
-        """아젠다 투표 이벤트"""
-        await message_handler.handle_message(SocketEventType.VOTE_AGENDA, sid, data)
-    
-    @sio.event
-    async def agenda_navigate(sid, data):
-        """아젠다 네비게이션 이벤트"""
-        await message_handler.handle_message(SocketEventType.AGENDA_NAVIGATE, sid, data)
-    
-    @sio.event
-    async def task_completed(sid, data):
-        """태스크 완료 이벤트"""
-        await message_handler.handle_message(SocketEventType.TASK_COMPLETED, sid, data)
-    
-    @sio.event
-    async def task_navigate(sid, data):
-        """태스크 네비게이션 이벤트"""
-        await message_handler.handle_message(SocketEventType.TASK_NAVIGATE, sid, data)
-    
-    @sio.event
-    async def agenda_vote_broadcast(sid, data):
-        """아젠다 투표 브로드캐스트 이벤트"""
-        await message_handler.handle_message(SocketEventType.AGENDA_VOTE_BROADCAST, sid, data)
-    
-    @sio.event
-    async def agenda_vote_completed(sid, data):
-        """아젠다 투표 완료 이벤트"""
-        await message_handler.handle_message(SocketEventType.AGENDA_VOTE_COMPLETED, sid, data)
-    
-    @sio.event
-    async def task_created(sid, data):
-        """태스크 생성 완료 이벤트"""
-        await message_handler.handle_message(SocketEventType.TASK_CREATED, sid, data)
+    # 단순 전달 이벤트 일괄 등록
+    for event_type in FORWARDED_EVENTS:
+        sio.on(event_type.value, _make_forward_handler(message_handler, event_type))
     
     # Socket.IO 앱을 FastAPI에 마운트
     socket_app = socketio.ASGIApp(sio, fastapi_app)
     
     # Socket.IO 엔드포인트 확인을 위한 로그
     logger.info("Socket.IO 앱이 FastAPI에 마운트되었습니다.")
-    logger.info(f"Socket.IO 엔드포인트: /socket.io/")
+    logger.info("Socket.IO 엔드포인트: /socket.io/")
     
     return socket_app
 
 # 유틸리티 함수들
 async def send_system_message(room_id: str, message: str) -> None:
     """시스템 메시지 전송"""
-    from datetime import datetime
+    # 방에 접속자가 없으면 페이로드 구성/인코딩 생략
+    if not sio.has_room_members(room_id):
+        return
+    
     await sio.emit('system_message', {
         'message': message,
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': now_iso(),
         'message_type': 'system'
     }, room=room_id)
     
     # 시스템 메시지 전송 로깅 추가
-    from .handler import log_socket_message
     log_socket_message('INFO', '전송', event='system_message', room=room_id, msg=message[:30])
 
 async def get_room_profile_count(room_id: str) -> int:
     """방의 현재 프로필 수 조회"""
-    return len(room_profiles.get(room_id, []))
-
-async def is_profile_in_room(profile_id: str, room_id: str) -> bool:
-    """프로필이 특정 방에 있는지 확인"""
-    for sid, profile_info in connected_profiles.items():
-        if profile_info['profile_id'] == profile_id and profile_info['current_room'] == room_id:
-            return True
-    return False 
\ No newline at end of file
+    return len(room_profiles.get(room_id, ()))
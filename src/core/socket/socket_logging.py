@@ -0,0 +1,29 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+def log_socket_message(level: str, message: str, **kwargs) -> None:
+    """소켓 메시지 전용 로깅 함수"""
+    log_level = logging.ERROR if level == 'ERROR' else logging.WARNING if level == 'WARNING' else logging.INFO
+    # 출력되지 않을 로그는 문자열 조립 전에 건너뜀
+    if not logger.isEnabledFor(log_level):
+        return
+    
+    colors = {
+        'INFO': '\033[94m',      # 파란색
+        'SUCCESS': '\033[92m',   # 초록색
+        'WARNING': '\033[93m',   # 노란색
+        'ERROR': '\033[91m',     # 빨간색
+    }
+    
+    color = colors.get(level, '')
+    reset = '\033[0m'
+    
+    # 한 줄로 모든 정보 정리
+    if kwargs:
+        details = " ".join([f"{k}={v}" for k, v in kwargs.items()])
+        log_msg = f"{color}[SOCKET] {message} {details}{reset}"
+    else:
+        log_msg = f"{color}[SOCKET] {message}{reset}"
+    
+    logger.log(log_level, log_msg)
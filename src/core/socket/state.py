@@ -0,0 +1,7 @@
+from typing import Any, Dict, Set
+
+# 소켓 연결/방 참가 상태 (server.py와 strategy.py가 import 순환 없이 공유)
+
+# 연결된 프로필 관리 (전역 상태)
+connected_profiles: Dict[str, Dict[str, Any]] = {}  # sid -> profile_info
+room_profiles: Dict[str, Set[str]] = {}  # room_id -> {sid1, sid2, ...}
@@ -1,305 +1,281 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from importlib import import_module
+from itertools import count
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional, Tuple
 import logging
-from .interfaces import BaseSocketMessage
+import os
+import time
+from pydantic import ValidationError
+from src.core.config import settings
+from src.modules.chat.dto import ChatSocketMessageRequest
+from src.modules.chat.enums import ChatType
+from src.modules.chat.service import chat_service
+from src.modules.profile.service import user_profile_service
+from .models.base_socket_message import BaseSocketMessage
 from .models.socket_event_type import SocketEventType
+from .socket_logging import log_socket_message
+from .timestamp import now_iso
+from .broadcast import broadcast_queue, emit_batcher
 import socketio
 
 logger = logging.getLogger(__name__)
 
+# 자주 전송되는 고정 에러 페이로드 (요청마다 dict를 새로 만들지 않도록 재사용, 수정 금지)
+_ERR_SERVER_BUSY = {'message': 'Server is busy. Please try again later.'}
+_ERR_NO_ROOM_ID = {'message': 'Room ID is required.'}
+_ERR_NO_MESSAGE = {'message': 'Message content is required.'}
+_ERR_NO_SESSION = {'message': 'Session not found.'}
+_ERR_SESSION_VALIDATION = {'message': 'An error occurred during session validation.'}
+_ERR_NO_PROFILE = {'message': 'Profile not found. Please create a profile first.'}
+_ERR_SEND_FAILED = {'message': 'An error occurred while sending the message.'}
+
+async def _encode_and_emit(sio: socketio.AsyncServer, sid: str, event: str, payload: Dict[str, Any], room_id: str, skip_sid: Optional[str] = None) -> bool:
+    """방에 브로드캐스트 - 접속자가 없는 방은 패킷 인코딩 없이 건너뜀
+    
+    실제 전송은 broadcast_queue의 drain 태스크가 담당하므로 수신 코루틴은 emit 완료를 기다리지 않음
+    """
+    if not sio.has_room_members(room_id):
+        return False
+    if emit_batcher is not None and skip_sid is None:
+        # write delay 설정 시 방 단위로 모아서 전송
+        emit_batcher.push(sio, event, payload, room_id)
+        return True
+    if not broadcast_queue.enqueue(sio, event, payload, room_id, skip_sid):
+        await sio.emit('error', _ERR_SERVER_BUSY, room=sid)
+        return False
+    return True
+
+# 메시지 ID 생성용 (기동 시각 + 프로세스 prefix + 단조 증가 카운터)
+# 기동 시각을 포함해 재시작 후 같은 PID가 재사용되어도 ID가 겹치지 않음
+_MESSAGE_ID_PREFIX = f"{time.time_ns() // 1_000_000:x}_{os.getpid():x}_"
+_message_seq = count()
+
+# 채팅 브로드캐스트 페이로드 템플릿 (키 순서 = 클라이언트로 전송되는 필드 순서)
+_MESSAGE_DATA_TEMPLATE: Dict[str, Any] = {
+    'id': '',
+    'profile_id': '',
+    'display_name': '',
+    'message': '',
+    'timestamp': '',
+    'message_type': 'text',
+    'encrypted': False
+}
+
+# 브로드캐스트 성공 로그 샘플링 (N건 중 1건만 기록)
+_LOG_SAMPLE_RATE = 128
+_log_sample_seq = count()
+
+def _should_log_sample() -> bool:
+    """샘플링 대상 로그인지 확인 - INFO 비활성 시 카운터도 증가시키지 않음"""
+    return logger.isEnabledFor(logging.INFO) and next(_log_sample_seq) % _LOG_SAMPLE_RATE == 0
+
+# 채팅 메시지 최대 길이 (원본은 앞뒤 공백 여유분 포함)
+MAX_CHAT_MESSAGE_LENGTH = 1000
+_MAX_RAW_CHAT_MESSAGE_LENGTH = 1024
+_ERR_MESSAGE_TOO_LONG = {'message': f'Message is too long. (Max {MAX_CHAT_MESSAGE_LENGTH} characters)'}
+
+async def _validate_chat_payload(sio: socketio.AsyncServer, sid: str, data: Dict[str, Any], default_message_type: str) -> Optional[Tuple[str, str, str]]:
+    """채팅 페이로드 검증 - 실패 시 에러 전송 후 None 반환"""
+    # 스키마 검증(ValidationError 생성 비용) 전에 흔한 거부 케이스를 원본 값으로 먼저 차단
+    # 과대 메시지는 strip 복사본을 만들기 전에 길이만으로 거부
+    if not data.get('room_id'):
+        await sio.emit('error', _ERR_NO_ROOM_ID, room=sid)
+        return None
+    raw_message = data.get('message')
+    if not raw_message or not isinstance(raw_message, str):
+        await sio.emit('error', _ERR_NO_MESSAGE, room=sid)
+        return None
+    if len(raw_message) > _MAX_RAW_CHAT_MESSAGE_LENGTH:
+        await sio.emit('error', _ERR_MESSAGE_TOO_LONG, room=sid)
+        return None
+    
+    try:
+        payload = ChatSocketMessageRequest.model_validate(data)
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error['loc'] and error['loc'][0] == 'room_id':
+            error_payload = _ERR_NO_ROOM_ID
+        elif error['type'] == 'string_too_long':
+            error_payload = _ERR_MESSAGE_TOO_LONG
+        else:
+            error_payload = _ERR_NO_MESSAGE
+        await sio.emit('error', error_payload, room=sid)
+        return None
+    
+    return payload.room_id, payload.message, payload.message_type or default_message_type
+
+async def _resolve_profile(sio: socketio.AsyncServer, sid: str, session: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """세션에 캐시된 (profile_id, display_name) 반환 - 없거나 TTL이 지나면 DB 조회 후 세션에 저장"""
+    profile_id = session.get('profile_id')
+    display_name = session.get('display_name')
+    if profile_id and display_name:
+        now = time.monotonic()
+        # 연결/방 입장 시 채워진 값은 첫 사용 시점부터 TTL 계산
+        cached_at = session.setdefault('profile_cached_at', now)
+        if now - cached_at < settings.SOCKETIO_PROFILE_CACHE_TTL_SECONDS:
+            return profile_id, display_name
+    
+    profile = await user_profile_service.get_profile_by_user_id(session['user_id'])
+    if not profile:
+        return None
+    
+    session['profile_id'] = profile.id
+    session['display_name'] = profile.display_name
+    session['profile_cached_at'] = time.monotonic()
+    await sio.save_session(sid, session)
+    return profile.id, profile.display_name
+
 class SocketMessageStrategy(ABC):
     """Socket message strategy interface"""
     
+    __slots__ = ()
+    
+    # 처리하는 이벤트 타입 (구현 클래스에서 클래스 속성으로 지정)
+    EVENT_TYPE: ClassVar[SocketEventType]
+    # 처리 중 예외 발생 시 클라이언트에 보낼 문구 (None이면 디스패처 기본 문구 사용)
+    ERROR_MESSAGE: ClassVar[Optional[str]] = None
+    
     @abstractmethod
     async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
         """Message handling abstract method - session parameter removed"""
         pass
     
-    @abstractmethod
     def get_event_type(self) -> SocketEventType:
         """Returns event type"""
-        pass
+        return self.EVENT_TYPE
     
     async def _validate_session(self, sio: socketio.AsyncServer, sid: str) -> Optional[Dict[str, Any]]:
         """Common session validation method"""
+        # 연결 시 저장된 세션은 동기 캐시에서 바로 반환 (예외 처리 없는 fast path)
+        session = sio.get_cached_session(sid)
+        if session:
+            return session
+        
+        # 캐시에 없을 때만 await (try는 await 한 줄만 감쌈)
         try:
             session = await sio.get_session(sid)
-            if not session:
-                await sio.emit('error', {'message': 'Session not found.'}, room=sid)
-                return None
-            return session
         except Exception as e:
-            logger.error(f"Session validation error for {sid}: {str(e)}")
-            await sio.emit('error', {'message': 'An error occurred during session validation.'}, room=sid)
+            logger.error("Session validation error for %s: %s", sid, e)
+            await sio.emit('error', _ERR_SESSION_VALIDATION, room=sid)
             return None
-
-class AuthConnectStrategy(SocketMessageStrategy):
-    """Authentication connection handling strategy"""
-    
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Connection does not require session validation
-        from src.modules.auth.socket_service import AuthSocketService
-        return await AuthSocketService.handle_connect(sio, sid, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CONNECT
-
-class AuthDisconnectStrategy(SocketMessageStrategy):
-    """Authentication disconnection handling strategy"""
-    
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Disconnection does not require session validation
-        from src.modules.auth.socket_service import AuthSocketService
-        return await AuthSocketService.handle_disconnect(sio, sid, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.DISCONNECT
-
-class RoomJoinStrategy(SocketMessageStrategy):
-    """Room entry handling strategy"""
-    
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Session validation required
-        session = await self._validate_session(sio, sid)
         if not session:
+            await sio.emit('error', _ERR_NO_SESSION, room=sid)
             return None
-        
-        from src.modules.room.socket_service import RoomSocketService
-        return await RoomSocketService.handle_join_room(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.JOIN_ROOM
-
-class RoomLeaveStrategy(SocketMessageStrategy):
-    """Room exit handling strategy"""
+        return session
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Session validation required
+    async def _handle_with_session(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any], handler) -> Optional[BaseSocketMessage]:
+        """Validate session then delegate to the service handler"""
         session = await self._validate_session(sio, sid)
         if not session:
             return None
-        
-        from src.modules.room.socket_service import RoomSocketService
-        return await RoomSocketService.handle_leave_room(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.LEAVE_ROOM
+        return await handler(sio, sid, session, data)
 
-class StartGameStrategy(SocketMessageStrategy):
-    """Game start handling strategy"""
+class ServiceHandlerStrategy(SocketMessageStrategy):
+    """소켓 서비스의 정적 메서드로 위임하는 전략 (기본은 세션 검증 후 위임)
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Session validation required
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.room.socket_service import RoomSocketService
-        return await RoomSocketService.handle_start_game(sio, sid, session, data)
+    서비스 모듈이 src.core.socket을 import하므로 모듈 로드 시점에는 참조할 수 없어
+    첫 호출 때 한 번만 resolve해서 클래스에 캐시한다.
+    """
     
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.START_GAME
-
-class FinishGameStrategy(SocketMessageStrategy):
-    """Game finish handling strategy"""
+    __slots__ = ()
+    
+    # (모듈 경로, 서비스 클래스명, 메서드명)
+    SERVICE_HANDLER: ClassVar[Tuple[str, str, str]]
+    # False면 세션 검증 없이 (sio, sid, data)로 호출 (connect/disconnect)
+    REQUIRES_SESSION: ClassVar[bool] = True
+    _service_handler: ClassVar[Optional[Callable[..., Awaitable[Optional[BaseSocketMessage]]]]] = None
     
     async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Session validation required
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.room.socket_service import RoomSocketService
-        return await RoomSocketService.handle_finish_game(sio, sid, session, data)
+        handler = type(self)._service_handler
+        if handler is None:
+            handler = self._resolve_service_handler()
+        if not self.REQUIRES_SESSION:
+            return await handler(sio, sid, data)
+        return await self._handle_with_session(sio, sid, data, handler)
+    
+    @classmethod
+    def _resolve_service_handler(cls) -> Callable[..., Awaitable[Optional[BaseSocketMessage]]]:
+        """SERVICE_HANDLER 경로를 import해서 서비스 메서드를 클래스에 캐시"""
+        module_path, service_name, method_name = cls.SERVICE_HANDLER
+        service = getattr(import_module(module_path), service_name)
+        cls._service_handler = getattr(service, method_name)
+        return cls._service_handler
+
+class AuthConnectStrategy(ServiceHandlerStrategy):
+    """Authentication connection handling strategy"""
     
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.FINISH_GAME
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CONNECT
+    # Connection does not require session validation
+    REQUIRES_SESSION = False
+    SERVICE_HANDLER = ('src.modules.auth.socket_service', 'AuthSocketService', 'handle_connect')
 
-class LobbyMessageStrategy(SocketMessageStrategy):
-    """Lobby message handling strategy"""
+class AuthDisconnectStrategy(ServiceHandlerStrategy):
+    """Authentication disconnection handling strategy"""
+    
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.DISCONNECT
+    # Disconnection does not require session validation
+    REQUIRES_SESSION = False
+    SERVICE_HANDLER = ('src.modules.auth.socket_service', 'AuthSocketService', 'handle_disconnect')
     
     async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Session validation required
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
         try:
-            room_id = data.get('room_id')
-            message = data.get('message', '').strip()
-            message_type = data.get('message_type', 'text')
-            
-            # 디버깅을 위한 로깅 추가
-            logger.info(f"LobbyMessageStrategy - room_id: {room_id}, message: {message[:20]}, user_id: {session.get('user_id')}")
-            
-            if not room_id:
-                await sio.emit('error', {'message': 'Room ID is required.'}, room=sid)
-                return None
-            
-            if not message:
-                await sio.emit('error', {'message': 'Message content is required.'}, room=sid)
-                return None
-            
-            if len(message) > 1000:
-                await sio.emit('error', {'message': 'Message is too long. (Max 1000 characters)'}, room=sid)
-                return None
-            
-            from datetime import datetime
-            import time
-            
-            from src.modules.profile.service import user_profile_service
-            profile = await user_profile_service.get_profile_by_user_id(session['user_id'])
-            if not profile:
-                logger.error(f"Profile not found for user_id: {session['user_id']}")
-                await sio.emit('error', {'message': 'Profile not found. Please create a profile first.'}, room=sid)
-                return None
-            
-            logger.info(f"Profile found: {profile.display_name} (ID: {profile.id})")
-            
-            # 메시지 데이터 구성
-            current_time = datetime.utcnow()
-            message_data = {
-                'id': f"lobby_{int(time.time() * 1000)}",
-                'profile_id': profile.id,
-                'display_name': profile.display_name,
-                'message': message,
-                'timestamp': current_time.isoformat(),
-                'message_type': message_type,
-                'encrypted': False
-            }
-
-            # DB에 메시지 저장
-            from src.modules.chat.service import chat_service
-            from src.modules.chat.enums import ChatType
-            
-            logger.info(f"Saving message to DB - room_id: {room_id}, profile_id: {profile.id}, message: {message[:20]}")
-            await chat_service.save_message(
-                room_id=room_id,
-                profile_id=profile.id,
-                display_name=profile.display_name,
-                message=message,
-                message_type=ChatType.LOBBY
-            )
-            logger.info(f"Message saved successfully to DB")
-            
-            # 해당 방의 모든 사용자에게 브로드캐스트
-            await sio.emit('lobby_message', message_data, room=room_id)
-            
-            # 브로드캐스트 로깅 추가
-            from .handler import log_socket_message
-            log_socket_message('SUCCESS', '브로드캐스트', event='lobby_message', room=room_id, profile=profile.display_name, msg=message[:30])
-            
-            logger.info(f"Lobby message sent by {profile.display_name} in room {room_id}")
-            
-            from .interfaces import BaseSocketMessage
-            return BaseSocketMessage(
-                event_type="lobby_message",
-                data={
-                    'room_id': room_id,
-                    'message': message,
-                    'profile_id': profile.id,
-                    'display_name': profile.display_name
-                }
-            )
-            
-        except Exception as e:
-            logger.error(f"Lobby message error for {sid}: {str(e)}")
-            logger.error(f"Exception type: {type(e).__name__}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            await sio.emit('error', {'message': 'An error occurred while sending the message.'}, room=sid)
-            return None
+            return await super().handle(sio, sid, data)
+        finally:
+            sio.drop_cached_session(sid)
+
+class RoomJoinStrategy(ServiceHandlerStrategy):
+    """Room entry handling strategy"""
     
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.LOBBY_MESSAGE
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.JOIN_ROOM
+    SERVICE_HANDLER = ('src.modules.room.socket_service', 'RoomSocketService', 'handle_join_room')
 
-class GameMessageStrategy(SocketMessageStrategy):
-    """Game message handling strategy"""
+class RoomLeaveStrategy(ServiceHandlerStrategy):
+    """Room exit handling strategy"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        # Session validation required
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        try:
-            room_id = data.get('room_id')
-            message = data.get('message', '').strip()
-            message_type = data.get('message_type', 'text')
-            
-            if not room_id:
-                await sio.emit('error', {'message': 'Room ID is required.'}, room=sid)
-                return None
-            
-            if not message:
-                await sio.emit('error', {'message': 'Message content is required.'}, room=sid)
-                return None
-            
-            if len(message) > 1000:
-                await sio.emit('error', {'message': 'Message is too long. (Max 1000 characters)'}, room=sid)
-                return None
-            
-            from datetime import datetime
-            import time
-            
-            from src.modules.profile.service import user_profile_service
-            profile = await user_profile_service.get_profile_by_user_id(session['user_id'])
-            if not profile:
-                await sio.emit('error', {'message': 'Profile not found. Please create a profile first.'}, room=sid)
-                return None
-            
-            # 메시지 데이터 구성
-            current_time = datetime.utcnow()
-            message_data = {
-                'id': f"game_{int(time.time() * 1000)}",
-                'profile_id': profile.id,
-                'display_name': profile.display_name,
-                'message': message,
-                'timestamp': current_time.isoformat(),
-                'message_type': message_type,
-                'encrypted': False
-            }
-
-            # DB에 메시지 저장
-            from src.modules.chat.service import chat_service
-            from src.modules.chat.enums import ChatType
-            
-            await chat_service.save_message(
-                room_id=room_id,
-                profile_id=profile.id,
-                display_name=profile.display_name,
-                message=message,
-                message_type=ChatType.GAME
-            )
-            
-            # 해당 방의 모든 사용자에게 브로드캐스트
-            await sio.emit('game_message', message_data, room=room_id)
-            
-            # 브로드캐스트 로깅 추가
-            from .handler import log_socket_message
-            log_socket_message('SUCCESS', '브로드캐스트', event='game_message', room=room_id, profile=profile.display_name, msg=message[:30])
-            
-            from .interfaces import BaseSocketMessage
-            return BaseSocketMessage(
-                event_type="game_message",
-                data={
-                    'room_id': room_id,
-                    'message': message,
-                    'profile_id': profile.id,
-                    'display_name': profile.display_name
-                }
-            )
-            
-        except Exception as e:
-            logger.error(f"Game message error for {sid}: {str(e)}")
-            await sio.emit('error', {'message': 'An error occurred while sending the message.'}, room=sid)
-            return None
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.LEAVE_ROOM
+    SERVICE_HANDLER = ('src.modules.room.socket_service', 'RoomSocketService', 'handle_leave_room')
+
+class StartGameStrategy(ServiceHandlerStrategy):
+    """Game start handling strategy"""
     
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.GAME_MESSAGE
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.START_GAME
+    SERVICE_HANDLER = ('src.modules.room.socket_service', 'RoomSocketService', 'handle_start_game')
 
-class SystemMessageStrategy(SocketMessageStrategy):
-    """System message handling strategy"""
+class FinishGameStrategy(ServiceHandlerStrategy):
+    """Game finish handling strategy"""
+    
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.FINISH_GAME
+    SERVICE_HANDLER = ('src.modules.room.socket_service', 'RoomSocketService', 'handle_finish_game')
+
+class ChatMessageStrategy(SocketMessageStrategy):
+    """Chat message handling strategy (lobby/game/system 공통)
+    
+    Client-sent system messages also need the session to resolve the sender profile.
+    Server-originated system messages use server.send_system_message, which skips this path.
+    """
+    
+    __slots__ = ('event_type', 'event_name', 'chat_type', 'id_prefix', 'default_message_type',
+                 'sample_logs', 'verbose', '_enqueue_message')
+    
+    def __init__(self, event_type: SocketEventType, chat_type: ChatType,
+                 default_message_type: str = 'text', sample_logs: bool = True, verbose: bool = False) -> None:
+        self.event_type = event_type
+        self.event_name = event_type.value
+        self.chat_type = chat_type
+        self.id_prefix = f"{chat_type.value}_{_MESSAGE_ID_PREFIX}"
+        self.default_message_type = default_message_type
+        # 고빈도 채팅(lobby/game)은 브로드캐스트 로그 샘플링
+        self.sample_logs = sample_logs
+        # 디버깅용 상세 로그 (lobby)
+        self.verbose = verbose
+        # 메시지마다 반복되는 서비스 속성 조회를 피하기 위해 바운드 메서드 보관
+        self._enqueue_message = chat_service.enqueue_message
     
     async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
         # Session validation required
@@ -308,330 +284,209 @@ class SystemMessageStrategy(SocketMessageStrategy):
             return None
         
         try:
-            room_id = data.get('room_id')
-            message = data.get('message', '').strip()
-            message_type = data.get('message_type', 'system')
-            
-            if not room_id:
-                await sio.emit('error', {'message': 'Room ID is required.'}, room=sid)
+            parsed = await _validate_chat_payload(sio, sid, data, self.default_message_type)
+            if parsed is None:
                 return None
-            
-            if not message:
-                await sio.emit('error', {'message': 'Message content is required.'}, room=sid)
+            room_id, message, message_type = parsed
+            
+            # 디버깅용 상세 로그 (DEBUG 레벨에서만 출력 - 흐름 추적은 log_socket_message로 충분)
+            debug = self.verbose and logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("%s message - room_id: %s, message: %.20s, user_id: %s", self.chat_type.value, room_id, message, session['user_id'])
+            
+            resolved = await _resolve_profile(sio, sid, session)
+            if not resolved:
+                if self.verbose:
+                    logger.error("Profile not found for user_id: %s", session['user_id'])
+                await sio.emit('error', _ERR_NO_PROFILE, room=sid)
                 return None
             
-            if len(message) > 1000:
-                await sio.emit('error', {'message': 'Message is too long. (Max 1000 characters)'}, room=sid)
-                return None
-            
-            from datetime import datetime
-            import time
-            
-            from src.modules.profile.service import user_profile_service
-            profile = await user_profile_service.get_profile_by_user_id(session['user_id'])
-            if not profile:
-                await sio.emit('error', {'message': 'Profile not found. Please create a profile first.'}, room=sid)
-                return None
-            
-            # 메시지 데이터 구성
-            current_time = datetime.utcnow()
-            message_data = {
-                'id': f"system_{int(time.time() * 1000)}",
-                'profile_id': profile.id,
-                'display_name': profile.display_name,
-                'message': message,
-                'timestamp': current_time.isoformat(),
-                'message_type': message_type,
-                'encrypted': False
-            }
-
-            # DB에 메시지 저장
-            from src.modules.chat.service import chat_service
-            from src.modules.chat.enums import ChatType
-            
-            await chat_service.save_message(
+            profile_id, display_name = resolved
+            if debug:
+                logger.debug("Profile found: %s (ID: %s)", display_name, profile_id)
+            
+            # 메시지 데이터 구성 (고정 키 템플릿 복사 후 값만 채움)
+            message_data = _MESSAGE_DATA_TEMPLATE.copy()
+            message_data['id'] = f"{self.id_prefix}{next(_message_seq):x}"
+            message_data['profile_id'] = profile_id
+            message_data['display_name'] = display_name
+            message_data['message'] = message
+            message_data['timestamp'] = now_iso()
+            message_data['message_type'] = message_type
+
+            # DB 저장 예약 (쓰기 버퍼에서 백그라운드 배치 insert - 브로드캐스트는 DB 응답을 기다리지 않음)
+            if debug:
+                logger.debug("Queueing message for DB - room_id: %s, profile_id: %s, message: %.20s", room_id, profile_id, message)
+            self._enqueue_message(
                 room_id=room_id,
-                profile_id=profile.id,
-                display_name=profile.display_name,
+                profile_id=profile_id,
+                display_name=display_name,
                 message=message,
-                message_type=ChatType.SYSTEM
+                message_type=self.chat_type
             )
+            if debug:
+                logger.debug("Message queued for DB")
             
             # 해당 방의 모든 사용자에게 브로드캐스트
-            await sio.emit('system_message', message_data, room=room_id)
+            await _encode_and_emit(sio, sid, self.event_name, message_data, room_id)
             
-            # 브로드캐스트 로깅 추가
-            from .handler import log_socket_message
-            log_socket_message('SUCCESS', '브로드캐스트', event='system_message', room=room_id, profile=profile.display_name, msg=message[:30])
+            # 브로드캐스트 로깅 (고빈도 경로이므로 샘플링)
+            if not self.sample_logs or _should_log_sample():
+                log_socket_message('SUCCESS', '브로드캐스트', event=self.event_name, room=room_id, profile=display_name, msg=message[:30])
             
-            from .interfaces import BaseSocketMessage
-            return BaseSocketMessage(
-                event_type="system_message",
-                data={
-                    'room_id': room_id,
-                    'message': message,
-                    'profile_id': profile.id,
-                    'display_name': profile.display_name
-                }
-            )
+            # 브로드캐스트한 message_data를 그대로 결과로 재사용 (신뢰된 값이므로 검증 생략)
+            return BaseSocketMessage.model_construct(event_type=self.event_name, data=message_data)
             
         except Exception as e:
-            logger.error(f"System message error for {sid}: {str(e)}")
-            await sio.emit('error', {'message': 'An error occurred while sending the message.'}, room=sid)
+            if self.verbose:
+                # 예외 타입/트레이스백은 로거가 출력할 때만 포맷됨
+                logger.exception("%s message error for %s: %s", self.chat_type.value.capitalize(), sid, e)
+            else:
+                logger.error("%s message error for %s: %s", self.chat_type.value.capitalize(), sid, e)
+            await sio.emit('error', _ERR_SEND_FAILED, room=sid)
             return None
     
     def get_event_type(self) -> SocketEventType:
-        return SocketEventType.SYSTEM_MESSAGE 
+        return self.event_type
 
-class ReadyStrategy(SocketMessageStrategy):
+# 채팅 전략 인스턴스 (STRATEGIES에 포함)
+LOBBY_CHAT = ChatMessageStrategy(SocketEventType.LOBBY_MESSAGE, ChatType.LOBBY, verbose=True)
+GAME_CHAT = ChatMessageStrategy(SocketEventType.GAME_MESSAGE, ChatType.GAME)
+SYSTEM_CHAT = ChatMessageStrategy(SocketEventType.SYSTEM_MESSAGE, ChatType.SYSTEM, default_message_type='system', sample_logs=False)
+
+class ReadyStrategy(ServiceHandlerStrategy):
     """Ready status handling strategy"""
     
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.READY
-
-    async def handle(self, sio, sid, data):
-        # Session validation required
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.room.socket_service import RoomSocketService
-        return await RoomSocketService.handle_ready(sio, sid, session, data) 
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.READY
+    SERVICE_HANDLER = ('src.modules.room.socket_service', 'RoomSocketService', 'handle_ready')
 
 # LLM 게임 관련 전략들
-class CreateGameStrategy(SocketMessageStrategy):
+class CreateGameStrategy(ServiceHandlerStrategy):
     """게임 생성 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_create_game(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CREATE_GAME
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CREATE_GAME
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_create_game')
 
-class CreateContextStrategy(SocketMessageStrategy):
+class CreateContextStrategy(ServiceHandlerStrategy):
     """컨텍스트 생성 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_create_context(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CREATE_CONTEXT
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CREATE_CONTEXT
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_create_context')
 
-class CreateAgendaStrategy(SocketMessageStrategy):
+class CreateAgendaStrategy(ServiceHandlerStrategy):
     """아젠다 생성 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_create_agenda(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CREATE_AGENDA
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CREATE_AGENDA
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_create_agenda')
 
-class CreateTaskStrategy(SocketMessageStrategy):
+class CreateTaskStrategy(ServiceHandlerStrategy):
     """태스크 생성 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_create_task(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CREATE_TASK
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CREATE_TASK
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_create_task')
 
-class CreateOvertimeStrategy(SocketMessageStrategy):
+class CreateOvertimeStrategy(ServiceHandlerStrategy):
     """오버타임 생성 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_create_overtime(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CREATE_OVERTIME
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CREATE_OVERTIME
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_create_overtime')
 
-class UpdateContextStrategy(SocketMessageStrategy):
+class UpdateContextStrategy(ServiceHandlerStrategy):
     """컨텍스트 업데이트 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_update_context(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.UPDATE_CONTEXT
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.UPDATE_CONTEXT
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_update_context')
 
-class CreateExplanationStrategy(SocketMessageStrategy):
+class CreateExplanationStrategy(ServiceHandlerStrategy):
     """설명 생성 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_create_explanation(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CREATE_EXPLANATION
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CREATE_EXPLANATION
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_create_explanation')
 
-class CalculateResultStrategy(SocketMessageStrategy):
+class CalculateResultStrategy(ServiceHandlerStrategy):
     """결과 계산 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_calculate_result(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.CALCULATE_RESULT
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.CALCULATE_RESULT
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_calculate_result')
 
-class GetGameProgressStrategy(SocketMessageStrategy):
+class GetGameProgressStrategy(ServiceHandlerStrategy):
     """게임 진행 상황 조회 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        session = await self._validate_session(sio, sid)
-        if not session:
-            return None
-        
-        from src.modules.game.socket_service import GameSocketService
-        return await GameSocketService.handle_get_game_progress(sio, sid, session, data)
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.GET_GAME_PROGRESS
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.GET_GAME_PROGRESS
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_get_game_progress')
 
 
-class AgendaVoteStrategy(SocketMessageStrategy):
+class AgendaVoteStrategy(ServiceHandlerStrategy):
     """아젠다 투표 소켓 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        """아젠다 투표 이벤트 처리"""
-        try:
-            # 사용자 인증 확인
-            session = await self._validate_session(sio, sid)
-            if not session:
-                await sio.emit('error', {
-                    "message": "인증되지 않은 사용자입니다."
-                }, room=sid)
-                return None
-            
-            user_id = session.get('user_id')
-            
-            # 간단한 투표 브로드캐스트
-            from src.modules.game.socket_service import GameSocketService
-            return await GameSocketService.handle_vote_agenda(sio, sid, session, data)
-                    
-        except Exception as e:
-            await sio.emit('error', {
-                "message": f"투표 처리 중 오류가 발생했습니다: {str(e)}"
-            }, room=sid)
-            return None
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.VOTE_AGENDA
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.VOTE_AGENDA
+    ERROR_MESSAGE = "투표 처리 중 오류가 발생했습니다"
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_vote_agenda')
 
 
-class AgendaNavigateStrategy(SocketMessageStrategy):
+class AgendaNavigateStrategy(ServiceHandlerStrategy):
     """아젠다 네비게이션 소켓 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        """아젠다 네비게이션 이벤트 처리"""
-        try:
-            # 사용자 인증 확인
-            session = await self._validate_session(sio, sid)
-            if not session:
-                await sio.emit('error', {
-                    "message": "인증되지 않은 사용자입니다."
-                }, room=sid)
-                return None
-            
-            from src.modules.game.socket_service import GameSocketService
-            return await GameSocketService.handle_agenda_navigate(sio, sid, session, data)
-                    
-        except Exception as e:
-            await sio.emit('error', {
-                "message": f"아젠다 네비게이션 처리 중 오류가 발생했습니다: {str(e)}"
-            }, room=sid)
-            return None
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.AGENDA_NAVIGATE
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.AGENDA_NAVIGATE
+    ERROR_MESSAGE = "아젠다 네비게이션 처리 중 오류가 발생했습니다"
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_agenda_navigate')
 
 
-class TaskCompletedStrategy(SocketMessageStrategy):
+class TaskCompletedStrategy(ServiceHandlerStrategy):
     """태스크 완료 소켓 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        """태스크 완료 이벤트 처리"""
-        try:
-            # 사용자 인증 확인
-            session = await self._validate_session(sio, sid)
-            if not session:
-                await sio.emit('error', {
-                    "message": "인증되지 않은 사용자입니다."
-                }, room=sid)
-                return None
-            
-            from src.modules.game.socket_service import GameSocketService
-            return await GameSocketService.handle_task_completed(sio, sid, session, data)
-                    
-        except Exception as e:
-            await sio.emit('error', {
-                "message": f"태스크 완료 처리 중 오류가 발생했습니다: {str(e)}"
-            }, room=sid)
-            return None
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.TASK_COMPLETED
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.TASK_COMPLETED
+    ERROR_MESSAGE = "태스크 완료 처리 중 오류가 발생했습니다"
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_task_completed')
 
 
-class TaskNavigateStrategy(SocketMessageStrategy):
+class TaskNavigateStrategy(ServiceHandlerStrategy):
     """태스크 네비게이션 소켓 전략"""
     
-    async def handle(self, sio: socketio.AsyncServer, sid: str, data: Dict[str, Any]) -> Optional[BaseSocketMessage]:
-        """태스크 네비게이션 이벤트 처리"""
-        try:
-            # 사용자 인증 확인
-            session = await self._validate_session(sio, sid)
-            if not session:
-                await sio.emit('error', {
-                    "message": "인증되지 않은 사용자입니다."
-                }, room=sid)
-                return None
-            
-            from src.modules.game.socket_service import GameSocketService
-            return await GameSocketService.handle_task_navigate(sio, sid, session, data)
-                    
-        except Exception as e:
-            await sio.emit('error', {
-                "message": f"태스크 네비게이션 처리 중 오류가 발생했습니다: {str(e)}"
-            }, room=sid)
-            return None
-    
-    def get_event_type(self) -> SocketEventType:
-        return SocketEventType.TASK_NAVIGATE 
\ No newline at end of file
+    __slots__ = ()
+    EVENT_TYPE = SocketEventType.TASK_NAVIGATE
+    ERROR_MESSAGE = "태스크 네비게이션 처리 중 오류가 발생했습니다"
+    SERVICE_HANDLER = ('src.modules.game.socket_service', 'GameSocketService', 'handle_task_navigate')
+
+
+# 기본 전략 인스턴스 (모두 상태가 없으므로 프로세스당 1개씩만 생성, 팩토리에서 등록)
+STRATEGIES: Tuple[SocketMessageStrategy, ...] = (
+    AuthConnectStrategy(),
+    AuthDisconnectStrategy(),
+    RoomJoinStrategy(),
+    RoomLeaveStrategy(),
+    StartGameStrategy(),
+    FinishGameStrategy(),
+    LOBBY_CHAT,
+    GAME_CHAT,
+    SYSTEM_CHAT,
+    ReadyStrategy(),
+    # 게임 관련 전략
+    CreateGameStrategy(),
+    CreateContextStrategy(),
+    CreateAgendaStrategy(),
+    CreateTaskStrategy(),
+    CreateOvertimeStrategy(),
+    UpdateContextStrategy(),
+    CreateExplanationStrategy(),
+    CalculateResultStrategy(),
+    GetGameProgressStrategy(),
+    # 아젠다/태스크 진행 전략
+    AgendaVoteStrategy(),
+    AgendaNavigateStrategy(),
+    TaskCompletedStrategy(),
+    TaskNavigateStrategy(),
+)
@@ -0,0 +1,8 @@
+from datetime import datetime
+
+# 모듈 속성 조회를 피하기 위해 바인딩
+_utcnow = datetime.utcnow
+
+def now_iso() -> str:
+    """현재 UTC 시각의 ISO 문자열 반환 (datetime.utcnow().isoformat()과 같은 마이크로초 정밀도)"""
+    return _utcnow().isoformat()
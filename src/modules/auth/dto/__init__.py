@@ -6,7 +6,7 @@ from .register_response import RegisterData, RegisterResponse
 from .refresh_response import RefreshData, RefreshResponse
 from .login_response import LoginData, LoginResponse
 from .user_response import UserData, UserResponse
-from .logout_response import LogoutData, LogoutResponse
+from .logout_response import LogoutInstructions, LogoutData, LogoutResponse
 from .delete_account_response import DeleteAccountData, DeleteAccountResponse
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
     "LoginResponse",
     "UserData",
     "UserResponse",
+    "LogoutInstructions",
     "LogoutData",
     "LogoutResponse",
     "DeleteAccountData",
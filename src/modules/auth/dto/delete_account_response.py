@@ -8,6 +8,9 @@ class DeleteAccountData(BaseModel):
     deleted_at: str
     
     class Config:
+        # 서버에서만 생성하는 응답 모델 - 불변, 정의되지 않은 필드 거부
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "user_id": "507f1f77bcf86cd799439011",
@@ -24,6 +27,8 @@ class DeleteAccountResponse(BaseModel):
     success: bool
     
     class Config:
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "data": {
@@ -1,12 +1,23 @@
 from pydantic import BaseModel
-from typing import Dict, Any
+
+
+class LogoutInstructions(BaseModel):
+    """로그아웃 후 클라이언트 처리 안내"""
+    client_action: str
+    
+    class Config:
+        # 서버에서만 생성하는 응답 모델 - 불변, 정의되지 않은 필드 거부
+        frozen = True
+        extra = "forbid"
 
 
 class LogoutData(BaseModel):
     """로그아웃 응답 데이터"""
-    instructions: Dict[str, Any]
+    instructions: LogoutInstructions
     
     class Config:
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "instructions": {
@@ -23,6 +34,8 @@ class LogoutResponse(BaseModel):
     success: bool
     
     class Config:
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "data": {
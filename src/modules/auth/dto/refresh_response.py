@@ -8,6 +8,9 @@ class RefreshData(BaseModel):
     expires_in: int
     
     class Config:
+        # 서버에서만 생성하는 응답 모델 - 불변, 정의되지 않은 필드 거부
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
@@ -24,6 +27,8 @@ class RefreshResponse(BaseModel):
     success: bool
     
     class Config:
+        frozen = True
+        extra = "forbid"
         json_schema_extra = {
             "example": {
                 "data": {
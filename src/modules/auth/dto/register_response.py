@@ -1,11 +1,12 @@
 from pydantic import BaseModel
+from typing import Optional
 
 
 class RegisterData(BaseModel):
     """회원가입 응답 데이터"""
     user_id: str
     username: str
-    email: str
+    email: Optional[str] = None
     created_at: str
     
     class Config:
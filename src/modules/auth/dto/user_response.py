@@ -7,7 +7,7 @@ class UserData(BaseModel):
     """사용자 정보 데이터"""
     id: str = Field(..., description="사용자 ID")
     username: str = Field(..., description="사용자명")
-    email: str = Field(..., description="이메일")
+    email: Optional[str] = Field(None, description="이메일")
     created_at: datetime = Field(..., description="계정 생성 시간")
     updated_at: Optional[datetime] = Field(None, description="계정 수정 시간")
     
@@ -1,11 +1,18 @@
 import logging
-from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from src.modules.user.service import user_service
 from src.modules.user.dto import UserCreateRequest, UserLoginRequest
+from pydantic import BaseModel
 from src.modules.auth.dto import (
-    RegisterData, RegisterResponse, 
-    RefreshResponse, LoginResponse, UserResponse, LogoutResponse, DeleteAccountResponse
+    RegisterData, RegisterResponse,
+    RefreshData, RefreshResponse,
+    LoginData, LoginResponse,
+    UserData, UserResponse,
+    LogoutInstructions, LogoutData, LogoutResponse,
+    DeleteAccountData, DeleteAccountResponse
 )
 from src.modules.profile.service import user_profile_service
 from src.core.jwt_utils import jwt_manager
@@ -15,6 +22,25 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["인증"])
 security = HTTPBearer()
 
+def _success_response(response: BaseModel) -> ORJSONResponse:
+    """응답 DTO를 JSON으로 직렬화해 반환
+
+    DTO는 서버에서 만든 값으로 model_construct해 전달하므로 검증 없이 덤프만 하고,
+    Response를 직접 반환해 FastAPI의 response_model 재검증/jsonable_encoder 단계를 건너뛴다.
+    """
+    return ORJSONResponse(response.model_dump(mode="json"))
+
+def _set_refresh_cookie(response: ORJSONResponse, refresh_token: str) -> None:
+    """refresh token을 HTTP-only 쿠키로 설정"""
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        secure=False,  # 개발환경에서는 False, 프로덕션에서는 True
+        samesite="lax",
+        max_age=7 * 24 * 60 * 60  # 7일
+    )
+
 @router.post("/register", response_model=RegisterResponse)
 async def register(user_data: UserCreateRequest):
     """사용자 회원가입 - 계정 생성만 처리"""
@@ -28,18 +54,16 @@ async def register(user_data: UserCreateRequest):
             # 프로필 생성 실패는 로그만 남기고 회원가입은 계속 진행
             print(f"프로필 생성 실패: {e}")
         
-        data = RegisterData(
-            user_id=user.id,
-            username=user.username,
-            email=user.email,
-            created_at=user.created_at.isoformat()
-        )
-        
-        return RegisterResponse(
-            data=data,
+        return _success_response(RegisterResponse.model_construct(
+            data=RegisterData.model_construct(
+                user_id=user.id,
+                username=user.username,
+                email=user.email,
+                created_at=user.created_at.isoformat()
+            ),
             message="회원가입이 완료되었습니다. 로그인해주세요.",
             success=True
-        )
+        ))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -47,7 +71,7 @@ async def register(user_data: UserCreateRequest):
         raise HTTPException(status_code=500, detail="회원가입 중 오류가 발생했습니다.")
 
 @router.post("/login", response_model=LoginResponse)
-async def login(login_data: UserLoginRequest, response: Response):
+async def login(login_data: UserLoginRequest):
     """사용자 로그인 - 토큰 발급 (refresh token은 HTTP-only 쿠키로 설정)"""
     try:
         user = await user_service.authenticate_user(login_data)
@@ -56,28 +80,18 @@ async def login(login_data: UserLoginRequest, response: Response):
         
         tokens = user_service.create_tokens(user)
         
-        # refresh token을 HTTP-only 쿠키로 설정
-        response.set_cookie(
-            key="refresh_token",
-            value=tokens.refresh_token,
-            httponly=True,
-            secure=False,  # 개발환경에서는 False, 프로덕션에서는 True
-            samesite="lax",
-            max_age=7 * 24 * 60 * 60  # 7일
-        )
-        
-        from .dto.login_response import LoginData
-        login_data = LoginData(
-            access_token=tokens.access_token,
-            token_type=tokens.token_type,
-            expires_in=tokens.expires_in
-        )
-        
-        return LoginResponse(
-            data=login_data,
+        response = _success_response(LoginResponse.model_construct(
+            data=LoginData.model_construct(
+                access_token=tokens.access_token,
+                token_type=tokens.token_type,
+                expires_in=tokens.expires_in
+            ),
             message="로그인이 성공했습니다.",
             success=True
-        )
+        ))
+        # refresh token을 HTTP-only 쿠키로 설정
+        _set_refresh_cookie(response, tokens.refresh_token)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -85,7 +99,7 @@ async def login(login_data: UserLoginRequest, response: Response):
         raise HTTPException(status_code=500, detail="로그인 중 오류가 발생했습니다.")
 
 @router.post("/refresh", response_model=RefreshResponse)
-async def refresh_token(request: Request, response: Response):
+async def refresh_token(request: Request):
     """토큰 갱신 - 쿠키에서 refresh token 읽기"""
     try:
         # 쿠키에서 refresh token 읽기
@@ -100,34 +114,26 @@ async def refresh_token(request: Request, response: Response):
         if payload.get("type") != "refresh":
             raise HTTPException(status_code=401, detail="잘못된 토큰 타입입니다.")
         
-        user = await user_service.get_user_by_id(payload["user_id"])
-        if not user:
+        # 토큰 재발급에는 사용자 문서 전체가 필요 없으므로 계정 유효 여부와 username만 조회
+        user_id = payload.get("user_id")
+        username = await user_service.get_active_username(user_id) if user_id else None
+        if not username:
             raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
         
-        tokens = user_service.create_tokens(user)
-        
-        # 새로운 refresh token을 HTTP-only 쿠키로 설정
-        response.set_cookie(
-            key="refresh_token",
-            value=tokens.refresh_token,
-            httponly=True,
-            secure=False,  # 개발환경에서는 False, 프로덕션에서는 True
-            samesite="lax",
-            max_age=7 * 24 * 60 * 60  # 7일
-        )
-        
-        from .dto.refresh_response import RefreshData
-        refresh_data = RefreshData(
-            access_token=tokens.access_token,
-            token_type=tokens.token_type,
-            expires_in=tokens.expires_in
-        )
+        tokens = user_service.create_tokens_for(user_id, username)
         
-        return RefreshResponse(
-            data=refresh_data,
+        response = _success_response(RefreshResponse.model_construct(
+            data=RefreshData.model_construct(
+                access_token=tokens.access_token,
+                token_type=tokens.token_type,
+                expires_in=tokens.expires_in
+            ),
             message="토큰이 성공적으로 갱신되었습니다.",
             success=True
-        )
+        ))
+        # 새로운 refresh token을 HTTP-only 쿠키로 설정
+        _set_refresh_cookie(response, tokens.refresh_token)
+        return response
     except HTTPException:
         raise
     except Exception as e:
@@ -149,19 +155,17 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         if not user:
             raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
         
-        from .dto.user_response import UserData
-        user_data = UserData(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            created_at=user.created_at,
-            updated_at=user.updated_at
-        )
-        return UserResponse(
-            data=user_data,
+        return _success_response(UserResponse.model_construct(
+            data=UserData.model_construct(
+                id=user.id,
+                username=user.username,
+                email=user.email,
+                created_at=user.created_at,
+                updated_at=user.updated_at
+            ),
             message="사용자 정보를 성공적으로 조회했습니다.",
             success=True
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
@@ -169,9 +173,18 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
         raise HTTPException(status_code=500, detail="사용자 정보 조회 중 오류가 발생했습니다.")
 
 @router.post("/logout", response_model=LogoutResponse)
-async def logout(response: Response):
+async def logout():
     """사용자 로그아웃 - refresh token 쿠키 삭제"""
     try:
+        response = _success_response(LogoutResponse.model_construct(
+            data=LogoutData.model_construct(
+                instructions=LogoutInstructions.model_construct(
+                    client_action="액세스 토큰을 로컬 저장소에서 삭제하고 Socket.IO 연결을 해제하세요."
+                )
+            ),
+            message="로그아웃이 완료되었습니다. 클라이언트에서 액세스 토큰을 삭제해주세요.",
+            success=True
+        ))
         # refresh token 쿠키 삭제
         response.delete_cookie(
             key="refresh_token",
@@ -179,18 +192,7 @@ async def logout(response: Response):
             secure=False,
             samesite="lax"
         )
-        
-        from .dto.logout_response import LogoutData
-        logout_data = LogoutData(
-            instructions={
-                "client_action": "액세스 토큰을 로컬 저장소에서 삭제하고 Socket.IO 연결을 해제하세요."
-            }
-        )
-        return LogoutResponse(
-            data=logout_data,
-            message="로그아웃이 완료되었습니다. 클라이언트에서 액세스 토큰을 삭제해주세요.",
-            success=True
-        )
+        return response
     except Exception as e:
         logger.exception("로그아웃 중 오류가 발생했습니다.")
         raise HTTPException(status_code=500, detail="로그아웃 중 오류가 발생했습니다.")
@@ -214,18 +216,16 @@ async def delete_account(credentials: HTTPAuthorizationCredentials = Depends(sec
         if not success:
             raise HTTPException(status_code=400, detail="계정 삭제에 실패했습니다.")
         
-        from datetime import datetime
-        from .dto.delete_account_response import DeleteAccountData
-        delete_data = DeleteAccountData(
-            user_id=user_id,
-            username=user.username if user else "unknown",
-            deleted_at=datetime.utcnow().isoformat()
-        )
-        return DeleteAccountResponse(
-            data=delete_data,
+        return _success_response(DeleteAccountResponse.model_construct(
+            data=DeleteAccountData.model_construct(
+                user_id=user_id,
+                # 삭제된 사용자는 다시 조회할 수 없으므로 토큰의 username 사용
+                username=payload.get("username", "unknown"),
+                deleted_at=datetime.utcnow().isoformat()
+            ),
             message="계정이 성공적으로 삭제되었습니다.",
             success=True
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
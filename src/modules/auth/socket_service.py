@@ -2,6 +2,8 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 from src.core.socket.models import AuthMessage, SocketEventType
+from src.modules.profile.service import user_profile_service
+from src.core.socket.state import room_profiles
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,13 @@ class AuthSocketService:
             'access_token': token,
             'connected_at': datetime.utcnow().isoformat()
         }
+        
+        # 프로필 정보를 세션에 캐시 (채팅 등 메시지마다 DB 조회하지 않도록)
+        profile = await user_profile_service.get_profile_by_user_id(payload["user_id"])
+        if profile:
+            session['profile_id'] = profile.id
+            session['display_name'] = profile.display_name
+        
         await sio.save_session(sid, session)
         
         # 연결 성공 응답
@@ -72,5 +81,13 @@ class AuthSocketService:
     @staticmethod
     async def handle_disconnect(sio, sid: str, data: Dict[str, Any]) -> Optional[AuthMessage]:
         """연결 해제 처리"""
-        # 연결 해제 시 별도 세션/connected_profiles 관리 없음
+        # 방을 나가지 않고 끊긴 sid를 방 사용자 목록에서 제거
+        session = sio.get_cached_session(sid)
+        room_id = session.get('current_room') if session else None
+        if room_id:
+            members = room_profiles.get(room_id)
+            if members is not None:
+                members.discard(sid)
+                if not members:
+                    del room_profiles[room_id]
         return None 
\ No newline at end of file
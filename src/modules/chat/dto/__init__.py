@@ -2,6 +2,7 @@ from .chat_history_request import ChatHistoryRequest
 from .chat_message_create_request import ChatMessageCreateRequest
 from .chat_message_response import ChatMessageResponse
 from .chat_message_send_request import ChatMessageSendRequest
+from .chat_socket_message_request import ChatSocketMessageRequest
 from .room_chat_history_response import RoomChatHistoryResponse
 from .chat_responses import GetChatHistoryResponse, DeleteChatHistoryResponse, DeleteChatHistoryData
 
@@ -10,6 +11,7 @@ __all__ = [
     "ChatMessageCreateRequest",
     "ChatMessageResponse",
     "ChatMessageSendRequest",
+    "ChatSocketMessageRequest",
     "RoomChatHistoryResponse",
     "GetChatHistoryResponse",
     "DeleteChatHistoryResponse",
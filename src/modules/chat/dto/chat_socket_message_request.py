@@ -0,0 +1,9 @@
+from typing import Optional
+from pydantic import BaseModel, Field, StringConstraints
+from typing_extensions import Annotated
+
+class ChatSocketMessageRequest(BaseModel):
+    """Chat message payload DTO for lobby/game/system socket events"""
+    room_id: str = Field(..., min_length=1, description="Room ID")
+    message: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=1000)] = Field(..., description="Message content")
+    message_type: Optional[str] = Field(None, description="Message type")
@@ -2,4 +2,5 @@ from enum import Enum
 
 class ChatType(str, Enum):
     LOBBY = "lobby"         # Lobby chat message
-    GAME = "game"           # Game chat message
\ No newline at end of file
+    GAME = "game"           # Game chat message
+    SYSTEM = "system"       # System message
\ No newline at end of file
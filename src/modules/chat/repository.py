@@ -9,6 +9,9 @@ class ChatRepository(BaseRepository[ChatMessage]):
     @abstractmethod
     async def find_by_room_id(self, room_id: str, skip: int = 0, limit: int = 0) -> List[ChatMessage]:
         pass
+    @abstractmethod
+    async def create_many(self, entities: List[ChatMessage]) -> List[str]:
+        pass
 
 class MongoChatRepository(ChatRepository):
     def __init__(self):
@@ -31,6 +34,8 @@ class MongoChatRepository(ChatRepository):
         return [msg for msg in messages if hasattr(msg, 'profile_id') and msg.profile_id]
     async def create(self, entity: ChatMessage) -> str:
         return await self._mongo_repo.create(entity)
+    async def create_many(self, entities: List[ChatMessage]) -> List[str]:
+        return await self._mongo_repo.create_many(entities)
     async def update(self, id: str, update_dict) -> bool:
         return await self._mongo_repo.update(id, update_dict)
     async def delete(self, id: str) -> bool:
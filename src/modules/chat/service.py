@@ -1,16 +1,27 @@
 from datetime import datetime
 from typing import List
 import logging
+from bson import ObjectId
+from bson.errors import InvalidId
 from src.modules.chat.models import ChatMessage
 from src.modules.chat.enums import ChatType
 from src.modules.chat.dto import ChatMessageResponse, RoomChatHistoryResponse
 from src.modules.chat.repository import get_chat_repository, ChatRepository
+from src.modules.chat.write_buffer import ChatWriteCoalescer
 
 logger = logging.getLogger(__name__)
 
+def _normalize_room_id(room_id: str) -> str:
+    """room_id를 ObjectId 정규 문자열로 변환 (ObjectId 형식이 아니면 그대로 사용)"""
+    try:
+        return str(ObjectId(room_id))
+    except (InvalidId, TypeError):
+        return room_id
+
 class ChatService:
     def __init__(self, chat_repository: ChatRepository = None):
         self.chat_repository = chat_repository or get_chat_repository()
+        self.write_buffer = ChatWriteCoalescer(self.chat_repository)
     
     async def save_message(
         self, 
@@ -22,19 +33,9 @@ class ChatService:
     ) -> ChatMessageResponse:
         """Save chat message"""
         logger.info(f"Saving message in room {room_id} by profile {profile_id}")
-        # room_id를 문자열로 저장
-        from bson import ObjectId
-        try:
-            # ObjectId로 변환 시도 후 문자열로 저장
-            object_id = ObjectId(room_id)
-            room_id_str = str(object_id)
-        except:
-            # 이미 문자열이면 그대로 사용
-            room_id_str = room_id
-        
         chat_message = ChatMessage(
             id=None,
-            room_id=room_id_str,
+            room_id=_normalize_room_id(room_id),
             profile_id=profile_id,
             display_name=display_name,
             message_type=message_type,
@@ -53,6 +54,29 @@ class ChatService:
             timestamp=chat_message.timestamp
         )
     
+    def enqueue_message(
+        self, 
+        room_id: str, 
+        profile_id: str, 
+        display_name: str, 
+        message: str, 
+        message_type: ChatType = ChatType.LOBBY
+    ) -> None:
+        """Buffer chat message for batched save (socket hot path, returns without waiting for DB)"""
+        self.write_buffer.enqueue(ChatMessage(
+            id=None,
+            room_id=_normalize_room_id(room_id),
+            profile_id=profile_id,
+            display_name=display_name,
+            message_type=message_type,
+            message=message,
+            timestamp=datetime.utcnow()
+        ))
+    
+    async def flush_pending_messages(self) -> None:
+        """Save all buffered chat messages"""
+        await self.write_buffer.close()
+    
     async def get_room_messages(
         self, 
         room_id: str, 
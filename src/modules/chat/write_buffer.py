@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import List, Optional, Set
+from src.modules.chat.models import ChatMessage
+from src.modules.chat.repository import ChatRepository
+
+logger = logging.getLogger(__name__)
+
+class ChatWriteCoalescer:
+    """채팅 메시지 쓰기 버퍼 - 일정 개수/시간 단위로 모아서 한 번에 insert"""
+
+    def __init__(self, chat_repository: ChatRepository, max_batch: int = 256, max_delay: float = 0.01,
+                 max_inflight: int = 4, max_retries: int = 3):
+        self.chat_repository = chat_repository
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        # 동시에 진행되는 flush 태스크 상한 (DB가 느려지면 태스크 대신 버퍼가 쌓임)
+        self.max_inflight = max_inflight
+        # insert 실패 시 같은 배치를 재시도하는 횟수 (배치별, 지수 백오프)
+        self.max_retries = max_retries
+        self._buffer: List[ChatMessage] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    def enqueue(self, chat_message: ChatMessage) -> None:
+        """메시지를 버퍼에 추가 - 배치가 차거나 max_delay가 지나면 백그라운드에서 flush"""
+        self._buffer.append(chat_message)
+        if len(self._buffer) >= self.max_batch:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        """flush 태스크 생성 (태스크 참조는 완료 시까지 보관)"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if len(self._flush_tasks) >= self.max_inflight:
+            # 진행 중인 flush가 끝나면 _on_flush_done에서 이어서 처리
+            return
+        task = asyncio.create_task(self.flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task) -> None:
+        """flush 완료 시 상한 때문에 미뤄진 버퍼가 있으면 다시 flush"""
+        self._flush_tasks.discard(task)
+        if self._buffer and self._timer is None:
+            self._schedule_flush()
+
+    async def flush(self) -> int:
+        """버퍼의 메시지를 한 번의 insert로 저장하고 저장 건수 반환
+
+        insert 실패 시 같은 배치를 이 코루틴 안에서 지수 백오프로 최대 max_retries회 재시도한다.
+        재시도 중에도 flush 태스크로 집계되므로 DB 장애 시 새 메시지는 버퍼에 쌓이고,
+        close()에서도 타이머 없이 재시도를 마친 뒤 반환된다.
+        """
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return 0
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.max_delay * (2 ** attempt))
+            try:
+                # 부분 insert 후 재시도 시 중복 저장 가능 (at-least-once)
+                await self.chat_repository.create_many(batch)
+                return len(batch)
+            except Exception as e:
+                if attempt < self.max_retries:
+                    logger.warning("Failed to flush %s chat messages, retry %s/%s: %s", len(batch), attempt + 1, self.max_retries, e)
+                else:
+                    logger.error("Failed to flush %s chat messages, dropping after %s retries: %s", len(batch), self.max_retries, e)
+        return 0
+
+    async def close(self) -> None:
+        """대기 중인 flush 완료 후 남은 버퍼 저장"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.flush()
@@ -2,6 +2,8 @@ import logging
 from typing import Dict, Any, Optional, Set
 from src.core.socket.models import BaseSocketMessage, SocketEventType
 from src.modules.game.service import game_service
+from src.modules.profile.service import user_profile_service
+from src.modules.room.service import room_service
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -165,7 +167,7 @@ class GameSocketService:
         # 즉시 모든 플레이어에게 로딩 시작 알림
         await sio.emit(SocketEventType.AGENDA_LOADING_STARTED, {
             'room_id': room_id,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }, room=room_id)
         
         # 아젠다 생성
@@ -226,7 +228,6 @@ class GameSocketService:
             return None
         
         # user_id로 프로필 정보 조회
-        from src.modules.profile.service import user_profile_service
         profile = await user_profile_service.get_profile_by_user_id(user_id)
         if not profile:
             await sio.emit('error', {'message': '프로필을 찾을 수 없습니다.'}, room=sid)
@@ -250,7 +251,7 @@ class GameSocketService:
             'player_id': profile_id,
             'player_name': player_name,
             'selected_option_id': selected_option_id,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         
         await sio.emit(SocketEventType.AGENDA_VOTE_BROADCAST, vote_broadcast_data, room=room_id)
@@ -258,7 +259,6 @@ class GameSocketService:
         logger.info(f"아젠다 투표 브로드캐스트: {room_id}, 플레이어: {player_name}")
         
         # 방 정보에서 총 플레이어 수 확인
-        from src.modules.room.service import room_service
         room = await room_service.get_room(room_id)
         if not room:
             await sio.emit('error', {'message': '방을 찾을 수 없습니다.'}, room=sid)
@@ -290,7 +290,7 @@ class GameSocketService:
                 'vote_counts': vote_counts,
                 'winning_option_id': winning_option_id,
                 'total_votes': total_players,
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcnow()
             }
             
             await sio.emit(SocketEventType.AGENDA_VOTE_COMPLETED, vote_completed_data, room=room_id)
@@ -300,8 +300,9 @@ class GameSocketService:
             # 해당 agenda의 투표 저장소만 초기화 (다른 agenda는 유지)
             vote_storage[room_id][agenda_id] = {}
         
-        return BaseSocketMessage(
-            event_type=SocketEventType.AGENDA_VOTE_BROADCAST,
+        # 브로드캐스트한 dict를 그대로 결과로 재사용 (신뢰된 값이므로 검증/복사 생략)
+        return BaseSocketMessage.model_construct(
+            event_type=SocketEventType.AGENDA_VOTE_BROADCAST.value,
             data=vote_broadcast_data
         )
     
@@ -322,14 +323,12 @@ class GameSocketService:
             return None
         
         # user_id로 프로필 정보 조회
-        from src.modules.profile.service import user_profile_service
         profile = await user_profile_service.get_profile_by_user_id(user_id)
         if not profile:
             await sio.emit('error', {'message': '프로필을 찾을 수 없습니다.'}, room=sid)
             return None
         
         # 방 정보 확인
-        from src.modules.room.service import room_service
         room = await room_service.get_room(room_id)
         if not room:
             await sio.emit('error', {'message': '방을 찾을 수 없습니다.'}, room=sid)
@@ -346,15 +345,16 @@ class GameSocketService:
             'action': action,
             'host_profile_id': profile.id,
             'host_display_name': profile.display_name,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         
         await sio.emit(SocketEventType.AGENDA_NAVIGATE, navigate_data, room=room_id)
         
         logger.info(f"아젠다 네비게이션 브로드캐스트: {room_id}, 액션: {action}, 호스트: {profile.display_name}")
         
-        return BaseSocketMessage(
-            event_type=SocketEventType.AGENDA_NAVIGATE,
+        # 브로드캐스트한 dict를 그대로 결과로 재사용 (신뢰된 값이므로 검증/복사 생략)
+        return BaseSocketMessage.model_construct(
+            event_type=SocketEventType.AGENDA_NAVIGATE.value,
             data=navigate_data
         )
     
@@ -377,7 +377,6 @@ class GameSocketService:
             return None
         
         # user_id로 프로필 정보 조회
-        from src.modules.profile.service import user_profile_service
         profile = await user_profile_service.get_profile_by_user_id(user_id)
         if not profile:
             await sio.emit('error', {'message': '프로필을 찾을 수 없습니다.'}, room=sid)
@@ -401,7 +400,7 @@ class GameSocketService:
             'player_id': profile_id,
             'player_name': player_name,
             'task_id': task_id,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         
         await sio.emit(SocketEventType.TASK_COMPLETED_BROADCAST, task_completed_data, room=room_id)
@@ -409,7 +408,6 @@ class GameSocketService:
         logger.info(f"태스크 완료 브로드캐스트: {room_id}, 플레이어: {player_name}, 태스크: {task_id}")
         
         # 방 정보에서 총 플레이어 수 확인
-        from src.modules.room.service import room_service
         room = await room_service.get_room(room_id)
         if not room:
             await sio.emit('error', {'message': '방을 찾을 수 없습니다.'}, room=sid)
@@ -421,8 +419,9 @@ class GameSocketService:
         
         logger.info(f"태스크 완료 현황: {room_id}, {completed_players}/{total_players} 플레이어 완료")
         
-        return BaseSocketMessage(
-            event_type=SocketEventType.TASK_COMPLETED_BROADCAST,
+        # 브로드캐스트한 dict를 그대로 결과로 재사용 (신뢰된 값이므로 검증/복사 생략)
+        return BaseSocketMessage.model_construct(
+            event_type=SocketEventType.TASK_COMPLETED_BROADCAST.value,
             data=task_completed_data
         )
     
@@ -442,14 +441,12 @@ class GameSocketService:
             return None
         
         # user_id로 프로필 정보 조회
-        from src.modules.profile.service import user_profile_service
         profile = await user_profile_service.get_profile_by_user_id(user_id)
         if not profile:
             await sio.emit('error', {'message': '프로필을 찾을 수 없습니다.'}, room=sid)
             return None
         
         # 방 정보 확인
-        from src.modules.room.service import room_service
         room = await room_service.get_room(room_id)
         if not room:
             await sio.emit('error', {'message': '방을 찾을 수 없습니다.'}, room=sid)
@@ -482,7 +479,7 @@ class GameSocketService:
             'room_id': room_id,
             'host_profile_id': profile.id,
             'host_display_name': profile.display_name,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         
         await sio.emit(SocketEventType.TASK_NAVIGATE, navigate_data, room=room_id)
@@ -493,8 +490,9 @@ class GameSocketService:
         
         logger.info(f"태스크 네비게이션 브로드캐스트: {room_id}, 호스트: {profile.display_name}")
         
-        return BaseSocketMessage(
-            event_type=SocketEventType.TASK_NAVIGATE,
+        # 브로드캐스트한 dict를 그대로 결과로 재사용 (신뢰된 값이므로 검증/복사 생략)
+        return BaseSocketMessage.model_construct(
+            event_type=SocketEventType.TASK_NAVIGATE.value,
             data=navigate_data
         )
     
@@ -516,7 +514,6 @@ class GameSocketService:
             return None
         
         # 방 정보 확인
-        from src.modules.room.service import room_service
         room = await room_service.get_room(room_id)
         if not room:
             await sio.emit('error', {'message': '방을 찾을 수 없습니다.'}, room=sid)
@@ -562,7 +559,7 @@ class GameSocketService:
         task_data = {
             'room_id': room_id,
             'task_list': converted_task_list,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         await sio.emit(SocketEventType.TASK_CREATED, task_data, room=room_id)
         
@@ -621,7 +618,7 @@ class GameSocketService:
         overtime_data = {
             'room_id': room_id,
             'task_list': converted_overtime_task_list,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         await sio.emit('overtime_created', overtime_data, room=room_id)
         
@@ -680,7 +677,7 @@ class GameSocketService:
             'company_context': result.company_context,
             'player_context_list': converted_player_context_list,
             'phase': 'explanation',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         await sio.emit('context_updated', context_updated_data, room=room_id)
         
@@ -764,7 +761,7 @@ class GameSocketService:
             'room_id': room_id,
             'game_result': result_dict['game_result'],
             'player_rankings': converted_player_rankings,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': datetime.utcnow()
         }
         await sio.emit('game_result_created', result_data, room=room_id)
         
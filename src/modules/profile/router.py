@@ -66,6 +66,10 @@ async def update_my_profile(
                 status_code=404, 
                 detail="Profile not found. Please create a profile first using POST /profile."
             )
+        
+        # 소켓 세션에 캐시된 display_name 무효화
+        from src.core.socket.server import sio
+        sio.invalidate_cached_profile(current_user.id)
         return UpdateProfileResponse(
             data=profile,
             message="Profile updated successfully.",
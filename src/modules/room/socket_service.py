@@ -1,9 +1,17 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 from src.core.socket.models import RoomMessage, SocketEventType
 from src.modules.room.service import room_service
 from src.modules.room.enums import PlayerRole
+from src.core.jwt_utils import jwt_manager
+from src.core.session_manager import session_manager
+from src.core.socket.socket_logging import log_socket_message
+from src.core.socket.state import room_profiles
+from src.modules.game.service import game_service
+from src.modules.profile.service import user_profile_service
+from src.modules.room.repository import get_room_repository
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +44,6 @@ class RoomSocketService:
             username = session['username']
             
             # Profile 정보 조회
-            from src.modules.profile.service import user_profile_service
             profile = await user_profile_service.get_profile_by_user_id(user_id)
             if not profile:
                 await sio.emit('error', {'message': 'Profile not found. Please create a profile first.'}, room=sid)
@@ -66,7 +73,6 @@ class RoomSocketService:
                 )
             
             # 세션 매니저를 통한 방 입장 (여러 방 접속 방지)
-            from src.core.session_manager import session_manager
             room_joined = await session_manager.join_room(sid, profile_id, room_id)
             if not room_joined:
                 await sio.emit('error', {'message': 'Failed to join room.'}, room=sid)
@@ -75,7 +81,7 @@ class RoomSocketService:
             # 이미 다른 방에 있다면 나가기 (기존 로직 유지)
             current_room = session.get('current_room')
             if current_room and current_room != room_id:
-                await RoomSocketService.handle_leave_room_internal(sio, sid, current_room)
+                await RoomSocketService.handle_leave_room_internal(sio, sid, current_room, session)
             
             # 데이터베이스에 플레이어 추가 (이미 있는 경우 무시)
             success = await room_service.add_player_to_room_by_profile_id(room_id, profile_id)
@@ -92,11 +98,10 @@ class RoomSocketService:
                 'username': username,
                 'display_name': profile.display_name,
                 'message': f'{profile.display_name} has joined.',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.utcnow()
             }, room=room_id)
             
             # 브로드캐스트 로깅 추가
-            from src.core.socket.handler import log_socket_message
             log_socket_message('SUCCESS', '브로드캐스트', event='join_room', room=room_id, profile=profile.display_name)
             
             # 세션 완전 재설정 (방 입장 시)
@@ -105,6 +110,7 @@ class RoomSocketService:
                 'username': session['username'],
                 'access_token': session.get('access_token'),
                 'profile_id': profile_id,  # profile_id 추가
+                'display_name': profile.display_name,
                 'current_room': room_id,
                 'connected_at': session.get('connected_at', datetime.utcnow().isoformat()),
                 'room_joined_at': datetime.utcnow().isoformat()
@@ -112,17 +118,11 @@ class RoomSocketService:
             await sio.save_session(sid, new_session)
             
             # 방 사용자 목록 업데이트 (기존 로직 유지)
-            from src.core.socket.server import room_profiles, connected_profiles
             if room_id not in room_profiles:
-                room_profiles[room_id] = []
-            room_profiles[room_id].append(sid)
-            
-            # 연결된 프로필 정보 업데이트
-            if sid in connected_profiles:
-                connected_profiles[sid]['current_room'] = room_id
+                room_profiles[room_id] = set()
+            room_profiles[room_id].add(sid)
             
             # 기존 토큰에 방 정보 추가
-            from src.core.jwt_utils import jwt_manager
             current_token = session.get('access_token')
             updated_token = None
             
@@ -160,11 +160,10 @@ class RoomSocketService:
                 await sio.emit('error', {'message': 'Room ID is required.'}, room=sid)
                 return None
             
-            await RoomSocketService.handle_leave_room_internal(sio, sid, room_id)
+            await RoomSocketService.handle_leave_room_internal(sio, sid, room_id, session)
             
             # user_id로 프로필 정보 조회
             user_id = session['user_id']
-            from src.modules.profile.service import user_profile_service
             profile = await user_profile_service.get_profile_by_user_id(user_id)
             profile_id = profile.id if profile else None
             
@@ -195,7 +194,6 @@ class RoomSocketService:
             user_id = session["user_id"]
 
             # 프로필 조회
-            from src.modules.profile.service import user_profile_service
             profile = await user_profile_service.get_profile_by_user_id(user_id)
             if not profile:
                 await sio.emit('error', {'message': 'Profile not found.'}, room=sid)
@@ -241,13 +239,12 @@ class RoomSocketService:
                 "host_profile_id": profile.id,
                 "host_display_name": profile.display_name,
                 "message": f"{profile.display_name}님이 게임을 시작했습니다.",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             }, room=room_id)
             
             # LLM 게임 생성을 비동기로 처리 (백그라운드에서 실행)
             async def create_llm_game():
                 try:
-                    from src.modules.game.service import game_service
                     game_result = await game_service.start_game(room_id, player_list)
                     
                     # story 브로드캐스트
@@ -255,7 +252,7 @@ class RoomSocketService:
                         'room_id': room_id,
                         'story': game_result.story,
                         'message': '게임 스토리가 생성되었습니다.',
-                        'timestamp': datetime.utcnow().isoformat()
+                        'timestamp': datetime.utcnow()
                     }, room=room_id)
                     
                     logger.info(f"Story 브로드캐스트 완료: {room_id}")
@@ -265,15 +262,13 @@ class RoomSocketService:
                     logger.info(f"게임 진행 상황 조회 완료: {room_id}, phase: {game_progress.get('phase', 'unknown')}")
                     
                     # 방에 연결된 모든 클라이언트에게 이벤트 전송
-                    from src.core.socket.server import room_profiles
-                    connected_clients = room_profiles.get(room_id, [])
+                    connected_clients = room_profiles.get(room_id, set())
                     logger.info(f"방 {room_id}에 연결된 클라이언트 수: {len(connected_clients)}")
                     
                     await sio.emit(SocketEventType.GAME_PROGRESS_UPDATED, game_progress, room=room_id)
                     logger.info(f"game_progress_updated 이벤트 전송 완료: {room_id}")
                     
                     # 브로드캐스트 로깅 추가
-                    from src.core.socket.handler import log_socket_message
                     log_socket_message('SUCCESS', '브로드캐스트', event='story_created', room=room_id, profile='system')
                     log_socket_message('SUCCESS', '브로드캐스트', event=SocketEventType.GAME_PROGRESS_UPDATED, room=room_id, profile='system')
                     
@@ -285,11 +280,9 @@ class RoomSocketService:
                     await sio.emit('error', {'message': f'게임 스토리 생성에 실패했습니다: {str(e)}'}, room=room_id)
             
             # 비동기로 LLM 게임 생성 시작
-            import asyncio
             asyncio.create_task(create_llm_game())
             
             # 브로드캐스트 로깅 추가
-            from src.core.socket.handler import log_socket_message
             log_socket_message('SUCCESS', '브로드캐스트', event='start_game', room=room_id, profile=profile.display_name)
             
             return RoomMessage(
@@ -320,7 +313,6 @@ class RoomSocketService:
             user_id = session["user_id"]
 
             # 프로필 조회
-            from src.modules.profile.service import user_profile_service
             profile = await user_profile_service.get_profile_by_user_id(user_id)
             if not profile:
                 await sio.emit('error', {'message': 'Profile not found.'}, room=sid)
@@ -339,11 +331,10 @@ class RoomSocketService:
                 "host_profile_id": profile.id,
                 "host_display_name": profile.display_name,
                 "message": f"{profile.display_name}님이 게임을 종료했습니다.",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             }, room=room_id)
             
             # 브로드캐스트 로깅 추가
-            from src.core.socket.handler import log_socket_message
             log_socket_message('SUCCESS', '브로드캐스트', event='finish_game', room=room_id, profile=profile.display_name)
             logger.info(f"finish_game event broadcasted successfully to room {room_id}")
             
@@ -391,7 +382,6 @@ class RoomSocketService:
             ready = data.get("ready", False)
 
             # 프로필 조회
-            from src.modules.profile.service import user_profile_service
             profile = await user_profile_service.get_profile_by_user_id(user_id)
             if not profile:
                 logger.error(f"Profile not found for user_id: {user_id}")
@@ -399,7 +389,6 @@ class RoomSocketService:
                 return None
 
             # 방 존재 여부 확인
-            from src.modules.room.repository import get_room_repository
             room_repo = get_room_repository()
             room = await room_repo.find_by_id(room_id)
             if not room:
@@ -426,7 +415,6 @@ class RoomSocketService:
             }, room=room_id)
             
             # 브로드캐스트 로깅 추가
-            from src.core.socket.handler import log_socket_message
             log_socket_message('SUCCESS', '브로드캐스트', event='ready', room=room_id, profile=profile.display_name, ready=ready, all_ready=all_ready)
             
             return RoomMessage(
@@ -440,10 +428,11 @@ class RoomSocketService:
             return None
     
     @staticmethod
-    async def handle_leave_room_internal(sio, sid: str, room_id: str):
-        """내부 방 나가기 처리"""
+    async def handle_leave_room_internal(sio, sid: str, room_id: str, session: Optional[Dict[str, Any]] = None):
+        """내부 방 나가기 처리 - 디스패처에서 검증한 세션이 있으면 그대로 사용"""
         try:
-            session = await sio.get_session(sid)
+            if session is None:
+                session = await sio.get_session(sid)
             if not session:
                 return
             
@@ -451,7 +440,6 @@ class RoomSocketService:
             username = session['username']
             
             # Profile 정보 조회
-            from src.modules.profile.service import user_profile_service
             profile = await user_profile_service.get_profile_by_user_id(user_id)
             if not profile:
                 await sio.emit('error', {'message': 'Profile not found. Please create a profile first.'}, room=sid)
@@ -462,7 +450,6 @@ class RoomSocketService:
             # 데이터베이스에서 플레이어 제거 (호스트인 경우 방 삭제)
             is_host = False
             # Room 모델을 직접 조회하여 get_player_by_profile_id 메서드 사용
-            from src.modules.room.repository import get_room_repository
             room_repo = get_room_repository()
             room = await room_repo.find_by_id(room_id)
             
@@ -488,11 +475,10 @@ class RoomSocketService:
                 await sio.emit('room_deleted', {
                     'room_id': room_id,
                     'message': f'Room has been deleted by host {profile.display_name}.',
-                    'timestamp': datetime.utcnow().isoformat()
+                    'timestamp': datetime.utcnow()
                 }, room=room_id)
                 
                 # 브로드캐스트 로깅 추가
-                from src.core.socket.handler import log_socket_message
                 log_socket_message('WARNING', '브로드캐스트', event='room_deleted', room=room_id, profile=profile.display_name)
             else:
                 # 일반 사용자 나가기
@@ -502,11 +488,10 @@ class RoomSocketService:
                     'username': username,
                     'display_name': profile.display_name,
                     'message': f'{profile.display_name} has left.',
-                    'timestamp': datetime.utcnow().isoformat()
+                    'timestamp': datetime.utcnow()
                 }, room=room_id)
                 
                 # 브로드캐스트 로깅 추가
-                from src.core.socket.handler import log_socket_message
                 log_socket_message('SUCCESS', '브로드캐스트', event='leave_room', room=room_id, profile=profile.display_name)
             
             # Socket.IO 방에서 나가기
@@ -517,12 +502,13 @@ class RoomSocketService:
                 'user_id': session['user_id'],
                 'username': session['username'],
                 'access_token': session.get('access_token'),
+                'profile_id': profile_id,
+                'display_name': profile.display_name,
                 'current_room': None,
                 'connected_at': session.get('connected_at', datetime.utcnow().isoformat())
             }
             
             # 토큰에서 방 정보 제거
-            from src.core.jwt_utils import jwt_manager
             current_token = session.get('access_token')
             if current_token:
                 updated_token = jwt_manager.remove_room_info_from_token(current_token)
@@ -531,19 +517,14 @@ class RoomSocketService:
             await sio.save_session(sid, cleaned_session)
             
             # 세션 매니저에서 방 나가기
-            from src.core.session_manager import session_manager
             await session_manager.leave_room(sid, profile_id)
             
             # 방 사용자 목록에서 제거 (기존 로직 유지)
-            from src.core.socket.server import room_profiles, connected_profiles
-            if room_id in room_profiles and sid in room_profiles[room_id]:
-                room_profiles[room_id].remove(sid)
+            if room_id in room_profiles:
+                room_profiles[room_id].discard(sid)
                 if not room_profiles[room_id]:
                     del room_profiles[room_id]
             
-            if sid in connected_profiles:
-                connected_profiles[sid]['current_room'] = None
-            
             logger.info(f"Profile {profile.display_name} left room {room_id}")
             
         except Exception as e:
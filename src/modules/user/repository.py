@@ -26,6 +26,11 @@ class UserRepository(BaseRepository[User]):
     async def find_by_username_exclude_id(self, username: str, exclude_id: str) -> Optional[User]:
         """사용자명으로 사용자 조회 (특정 ID 제외)"""
         pass
+    
+    @abstractmethod
+    async def find_username_by_id(self, user_id: str) -> Optional[str]:
+        """삭제되지 않은 사용자의 사용자명만 조회"""
+        pass
 
 class MongoUserRepository(UserRepository):
     """MongoDB User Repository 구현체"""
@@ -134,6 +139,16 @@ class MongoUserRepository(UserRepository):
         """이메일로 사용자 조회"""
         return await self.find_one({"email": email})
     
+    async def find_username_by_id(self, user_id: str) -> Optional[str]:
+        """삭제되지 않은 사용자의 사용자명만 조회 (전체 문서/엔티티 변환 없이 username 필드만 projection)"""
+        from bson import ObjectId
+        try:
+            object_id = ObjectId(user_id)
+        except Exception:
+            return None
+        doc = await self._mongo_repo.find_fields({"_id": object_id, "is_deleted": False}, ["username"])
+        return doc.get("username") if doc else None
+    
     async def update_last_login(self, user_id: str) -> bool:
         """마지막 로그인 시간 업데이트"""
         try:
@@ -1,4 +1,6 @@
+import asyncio
 import hashlib
+import hmac
 import secrets
 from datetime import datetime
 from typing import Optional, Tuple
@@ -9,6 +11,22 @@ class UserService:
     def __init__(self, user_repository: UserRepository = None):
         self.user_repository = user_repository or get_user_repository()
     
+    def _to_user_response(self, user, **extra) -> UserResponse:
+        """User 엔티티를 UserResponse로 변환 (비밀번호 정보 제거)
+        
+        엔티티는 이미 검증된 값이므로 model_construct로 재검증(EmailStr 검사 포함)을 생략한다.
+        """
+        return UserResponse.model_construct(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            nickname=user.nickname,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login=user.last_login,
+            **extra
+        )
+    
     def generate_salt(self) -> str:
         """Generate unique salt for each user"""
         return secrets.token_hex(32)  # 64-character hex string
@@ -31,8 +49,8 @@ class UserService:
         return hashed_password, salt
     
     def verify_password(self, password: str, hashed_password: str, salt: str) -> bool:
-        """Verify password"""
-        return self.hash_password_with_salt(password, salt) == hashed_password
+        """Verify password (constant-time comparison)"""
+        return hmac.compare_digest(self.hash_password_with_salt(password, salt), hashed_password)
     
     async def create_user(self, user_data: UserCreateRequest) -> UserResponse:
         """사용자 생성"""
@@ -41,8 +59,9 @@ class UserService:
         if existing_user:
             raise ValueError("이미 존재하는 사용자명입니다.")
         
-        # 비밀번호 해싱 (salt 포함)
-        hashed_password, salt = self.create_password_hash(user_data.password)
+        # 비밀번호 해싱 (salt 포함) - PBKDF2 10만 회는 수십 ms 걸리므로 스레드에서 실행
+        # (hashlib.pbkdf2_hmac은 GIL을 놓고 OpenSSL에서 계산하므로 이벤트 루프를 막지 않음)
+        hashed_password, salt = await asyncio.to_thread(self.create_password_hash, user_data.password)
         
         # 사용자 엔티티 생성
         from .models import User
@@ -62,15 +81,7 @@ class UserService:
         user.id = user_id
         
         # UserResponse로 변환 (비밀번호 정보 제거)
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            nickname=user.nickname,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login=user.last_login
-        )
+        return self._to_user_response(user)
     
     async def authenticate_user(self, login_data: UserLoginRequest) -> Optional[UserResponse]:
         """사용자 인증"""
@@ -82,23 +93,15 @@ class UserService:
         if not user.salt:
             return None
         
-        # PBKDF2 + salt 방식으로 비밀번호 검증
-        if not self.verify_password(login_data.password, user.password, user.salt):
+        # PBKDF2 + salt 방식으로 비밀번호 검증 (해싱과 같은 이유로 스레드에서 실행)
+        if not await asyncio.to_thread(self.verify_password, login_data.password, user.password, user.salt):
             return None
         
         # 마지막 로그인 시간 업데이트
         await self.user_repository.update_last_login(user.id)
         
         # UserResponse로 변환 (비밀번호 정보 제거)
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            nickname=user.nickname,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login=user.last_login
-        )
+        return self._to_user_response(user)
     
     async def get_user_by_id(self, user_id: str) -> Optional[UserResponse]:
         """사용자 ID로 조회"""
@@ -107,23 +110,28 @@ class UserService:
             return None
         
         # UserResponse로 변환 (비밀번호 정보 제거)
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            nickname=user.nickname,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login=user.last_login
-        )
+        return self._to_user_response(user)
+    
+    async def get_active_username(self, user_id: str) -> Optional[str]:
+        """삭제되지 않은 사용자의 사용자명 조회 (토큰 재발급용 경량 조회)"""
+        return await self.user_repository.find_username_by_id(user_id)
     
     def create_tokens(self, user: UserResponse):
         """토큰 쌍 생성"""
+        return self.create_tokens_for(user.id, user.username)
+    
+    def create_tokens_for(self, user_id: str, username: str):
+        """사용자 ID/사용자명으로 토큰 쌍 생성 (직접 발급한 토큰이므로 TokenData는 검증 없이 생성)"""
         # 순환참조 방지를 위해 함수 내부에서 import
         from src.core.jwt_utils import jwt_manager
         from src.modules.auth.dto import TokenData
-        token_pair = jwt_manager.create_token_pair(user.id, user.username)
-        return TokenData(**token_pair.model_dump(), user=user)
+        token_pair = jwt_manager.create_token_pair(user_id, username)
+        return TokenData.model_construct(
+            access_token=token_pair.access_token,
+            refresh_token=token_pair.refresh_token,
+            token_type=token_pair.token_type,
+            expires_in=token_pair.expires_in
+        )
     
     async def delete_user(self, user_id: str) -> bool:
         """사용자 계정 삭제 (프로필도 함께 삭제)"""
@@ -159,14 +167,8 @@ class UserService:
             return None
         
         # UserResponse로 변환 (관리자 정보 포함)
-        return UserResponse(
-            id=user.id,
-            username=user.username,
-            email=user.email,
-            nickname=user.nickname,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login=user.last_login,
+        return self._to_user_response(
+            user,
             is_admin=getattr(user, 'is_admin', False),
             role=getattr(user, 'role', 'user')
         )